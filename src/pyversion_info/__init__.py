@@ -19,17 +19,18 @@ Visit <https://github.com/jwodder/pyversion-info> or
 
 from __future__ import annotations
 from collections import OrderedDict
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
-import json
+from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from cachecontrol import CacheControl
-from cachecontrol.caches.file_cache import FileCache
-from platformdirs import user_cache_dir
-import requests
-from .util import MajorVersion, MicroVersion, MinorVersion, RawDatabase
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+from .util import MajorVersion, MicroVersion, MinorVersion, json_loads
+
+if TYPE_CHECKING:
+    import requests
 
 __version__ = "1.3.0.dev1"
 __author__ = "John Thorvald Wodder II"
@@ -53,8 +54,56 @@ DATA_URL = (
     "/pyversion-info-data.v1.json"
 )
 
-#: The default directory in which the downloaded version database is cached
-CACHE_DIR = user_cache_dir("pyversion-info", "jwodder")
+
+def _today() -> date:
+    # All "current date" lookups go through here so that the tests can fix the
+    # date without having to mock `time.time()`.
+    return date.today()
+
+
+@lru_cache(maxsize=None)
+def _get_cache_dir() -> str:
+    # platformdirs is only imported once the cache directory is actually
+    # needed so that offline uses of the library don't pay for it.
+    from platformdirs import user_cache_dir
+
+    return user_cache_dir("pyversion-info", "jwodder")
+
+
+if TYPE_CHECKING:
+    CACHE_DIR: str
+else:
+    # Declaring `__getattr__` only at runtime keeps type checkers from
+    # treating every attribute of the module as a `str`
+
+    def __getattr__(name: str) -> str:
+        # Computes `CACHE_DIR` on first access
+        if name == "CACHE_DIR":
+            return _get_cache_dir()
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _Default(Enum):
+    # Sentinel for the default value of `VersionDatabase.fetch()`'s
+    # ``cache_dir`` parameter, which is resolved to `CACHE_DIR` lazily
+    CACHE_DIR = "CACHE_DIR"
+
+    def __repr__(self) -> str:
+        # Shown as the default in `help(VersionDatabase.fetch)`
+        return "CACHE_DIR"
+
+
+# Typed as `Any` so that `fetch()`'s public annotation needn't mention
+# `_Default`
+_DEFAULT_CACHE_DIR: Any = _Default.CACHE_DIR
+
+
+# Mapping from cache directories (or `None` for no caching) to HTTP sessions
+# that are reused across calls to `VersionDatabase.fetch()`.  `_SESSION_LOCK`
+# guards lookups in & changes to the mapping only; requests are made outside
+# of it so that concurrent fetches don't wait on each other.
+_SESSION_CACHE: dict[Optional[str], requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
 
 
 @dataclass
@@ -78,25 +127,56 @@ class VersionDatabase:
 
     @classmethod
     def fetch(
-        cls, url: str = DATA_URL, cache_dir: str | Path | None = CACHE_DIR
+        cls,
+        url: str = DATA_URL,
+        cache_dir: str | Path | None = _DEFAULT_CACHE_DIR,
     ) -> VersionDatabase:
         """
         Fetches the latest version information from the JSON document at
         ``url`` and returns a new `VersionDatabase` instance
 
+        .. versionchanged:: 1.3.0
+            The HTTP session used for each ``cache_dir`` is now kept open &
+            reused by subsequent calls; call `clear_session_cache()` to close
+            them.
+
         :param str url: The URL from which to fetch the data
         :param cache_dir: The directory to use for caching HTTP requests.  May
-            be `None` to disable caching.
+            be `None` to disable caching.  Defaults to `CACHE_DIR`.
         :type cache_dir: str | Path | None
         :rtype: VersionDatabase
         """
-        s = requests.Session()
-        if cache_dir is not None:
-            s = CacheControl(s, cache=FileCache(str(cache_dir)))
-        with s:
-            r = s.get(url)
-            r.raise_for_status()
-            return cls.parse_obj(r.json())
+        from cachecontrol import CacheControl
+        from cachecontrol.caches.file_cache import FileCache
+        import requests
+
+        if cache_dir is _DEFAULT_CACHE_DIR:
+            cache_dir = _get_cache_dir()
+        key = None if cache_dir is None else str(cache_dir)
+        with _SESSION_LOCK:
+            s = _SESSION_CACHE.get(key)
+            if s is None:
+                s = requests.Session()
+                if key is not None:
+                    s = CacheControl(s, cache=FileCache(key))
+                _SESSION_CACHE[key] = s
+        r = s.get(url)
+        r.raise_for_status()
+        return cls.parse_obj(json_loads(r.content))
+
+    @staticmethod
+    def clear_session_cache() -> None:
+        """
+        .. versionadded:: 1.3.0
+
+        Close & discard the HTTP sessions kept open by `fetch()`, causing the
+        next call to `fetch()` to start a fresh session
+        """
+        with _SESSION_LOCK:
+            sessions = list(_SESSION_CACHE.values())
+            _SESSION_CACHE.clear()
+        for s in sessions:
+            s.close()
 
     @classmethod
     def parse_file(cls, filepath: str | Path) -> VersionDatabase:
@@ -105,7 +185,7 @@ class VersionDatabase:
         `VersionDatabase` instance
         """
         with open(filepath, "rb") as fp:
-            return cls.parse_obj(json.load(fp))
+            return cls.parse_obj(json_loads(fp.read()))
 
     @classmethod
     def parse_obj(cls, data: dict) -> VersionDatabase:
@@ -113,6 +193,8 @@ class VersionDatabase:
         Parses a version database from a `dict` deserialized from a JSON
         document and returns a new `VersionDatabase` instance
         """
+        from .models import RawDatabase
+
         rawdb = RawDatabase.model_validate(data)
         return cls(
             last_modified=rawdb.last_modified,
@@ -133,10 +215,10 @@ class VersionInfo:
     def __init__(self, release_dates: Mapping[MicroVersion, date | bool]) -> None:
         self.release_dates: dict[MicroVersion, date | bool] = dict(release_dates)
         self.version_trie: dict[int, dict[int, list[int]]] = OrderedDict()
-        for v in sorted(release_dates.keys()):
-            self.version_trie.setdefault(v.x, OrderedDict()).setdefault(v.y, []).append(
-                v.z
-            )
+        # Sort plain int triples rather than the version objects themselves so
+        # that comparisons happen in C instead of via `Version.__lt__()`
+        for x, y, z in sorted((v.x, v.y, v.z) for v in release_dates.keys()):
+            self.version_trie.setdefault(x, OrderedDict()).setdefault(y, []).append(z)
 
     def major_versions(self) -> list[str]:
         """
@@ -189,18 +271,24 @@ class VersionInfo:
         :raises ValueError: if ``version`` is not a valid major or minor
             version string
         """
+        return list(self._iter_subversions(version))
+
+    def _iter_subversions(self, version: str) -> Iterator[str]:
+        # Like `subversions()`, but the subversions are generated lazily.
+        # Errors are still raised immediately.
         v = parse_version(version)
         try:
             if isinstance(v, MajorVersion):
-                subs = [f"{v.x}.{y}" for y in self.version_trie[v.x].keys()]
+                ys = self.version_trie[v.x].keys()
+                return (f"{v.x}.{y}" for y in ys)
             elif isinstance(v, MinorVersion):
-                subs = [f"{v.x}.{v.y}.{z}" for z in self.version_trie[v.x][v.y]]
+                zs = self.version_trie[v.x][v.y]
+                return (f"{v.x}.{v.y}.{z}" for z in zs)
             else:
                 assert isinstance(v, MicroVersion)
                 raise ValueError(f"Micro versions do not have subversions: {version!r}")
         except KeyError:
             raise UnknownVersionError(version)
-        return subs
 
     def _release_date(self, version: str) -> date | bool:
         v = parse_version(version)
@@ -255,7 +343,7 @@ class VersionInfo:
         """
         d = self._release_date(version)
         if isinstance(d, date):
-            return d <= date.today()
+            return d <= _today()
         else:
             return d
 
@@ -293,13 +381,15 @@ class CPythonVersionInfo(VersionInfo):
         v = parse_version(version)
         try:
             if isinstance(v, MajorVersion):
+                # Look up every subversion first so that a missing entry is
+                # always reported, even if an earlier subversion isn't EOL yet
                 subdates = [
                     self.eol_dates[MinorVersion.construct(v.x, y)]
                     for y in self.version_trie[v.x].keys()
                 ]
+                today = _today()
                 if all(
-                    (isinstance(d, date) and d <= date.today()) or d is True
-                    for d in subdates
+                    (isinstance(d, date) and d <= today) or d is True for d in subdates
                 ):
                     return subdates[-1]
                 else:
@@ -360,7 +450,7 @@ class CPythonVersionInfo(VersionInfo):
         """
         d = self._eol_date(series)
         if isinstance(d, date):
-            return d <= date.today()
+            return d <= _today()
         else:
             return d
 
@@ -378,10 +468,10 @@ class CPythonVersionInfo(VersionInfo):
         """
         v = parse_version(version)
         if isinstance(v, MajorVersion):
-            return any(map(self.is_supported, self.subversions(v)))
+            return any(self.is_supported(s) for s in self._iter_subversions(v))
         elif isinstance(v, MinorVersion):
             return (not self.is_eol(v)) and any(
-                map(self.is_released, self.subversions(v))
+                self.is_released(s) for s in self._iter_subversions(v)
             )
         else:
             assert isinstance(v, MicroVersion)
@@ -486,13 +576,20 @@ class UnknownVersionError(ValueError):
         return f"Unknown version: {self.version!r}"
 
 
+# Every query method parses its argument, and callers tend to ask about the
+# same handful of versions over and over, so the results are cached.  (Version
+# instances are never mutated after construction, so sharing them is safe.)
+@lru_cache(maxsize=2048)
 def parse_version(s: str) -> MajorVersion | MinorVersion | MicroVersion:
     """
     Convert a version string of the form ``X``, ``X.Y``, or ``X.Y.Z`` to a
-    `Version` instance
+    `Version` instance.  If ``s`` is already a `Version` instance, it is
+    returned unchanged.
 
     :raises ValueError: if ``s`` is not a valid version string
     """
+    if isinstance(s, (MajorVersion, MinorVersion, MicroVersion)):
+        return s
     dots = s.count(".")
     try:
         if dots == 0:
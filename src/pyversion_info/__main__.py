@@ -15,6 +15,25 @@ from . import (
 )
 from .util import MajorVersion, MicroVersion, MinorVersion
 
+LABELS = {
+    "version": "Version",
+    "level": "Level",
+    "release_date": "Release-Date",
+    "is_released": "Is-Released",
+    "is_supported": "Is-Supported",
+    "eol_date": "EOL-Date",
+    "is_eol": "Is-EOL",
+    "subversions": "Subversions",
+    "cpython_series": "CPython-Series",
+    "cpython": "CPython",
+}
+
+LEVELS: dict[type, str] = {
+    MajorVersion: "major",
+    MinorVersion: "minor",
+    MicroVersion: "micro",
+}
+
 
 def map_exc_to_click(func: Callable) -> Callable:
     @wraps(func)
@@ -94,13 +113,10 @@ def main(ctx: click.Context, database: Optional[str]) -> None:
 def list_cmd(vd: VersionDatabase, level: str, mode: str, py: str) -> None:
     """List known versions at the given version level"""
     info = vd.pypy if py == "pypy" else vd.cpython
-    func = {
-        "major": info.major_versions,
-        "minor": info.minor_versions,
-        "micro": info.micro_versions,
-    }[level]
-    for v in filter_versions(mode, info, func()):
-        print(v)
+    # `level` has already been validated by click.Choice
+    func = getattr(info, f"{level}_versions")
+    versions = filter_versions(mode, info, func())
+    click.echo("".join(f"{v}\n" for v in versions), nl=False)
 
 
 @main.command()
@@ -135,70 +151,20 @@ def show(
     """Show information about a Python version"""
     info = vd.pypy if py == "pypy" else vd.cpython
     v = parse_version(version)
-    data: list[tuple[str, str, Any]] = [
-        ("version", "Version", str(v)),
-        # ("level", "Level", ---),
-        ("release_date", "Release-Date", info.release_date(v)),
-        ("is_released", "Is-Released", info.is_released(v)),
-    ]
-    if isinstance(info, CPythonVersionInfo):
-        data.append(("is_supported", "Is-Supported", info.is_supported(v)))
-    if isinstance(v, MajorVersion):
-        data.insert(1, ("level", "Level", "major"))
-        if isinstance(info, CPythonVersionInfo):
-            data.append(("eol_date", "EOL-Date", info.eol_date(v)))
-            data.append(("is_eol", "Is-EOL", info.is_eol(v)))
-        data.append(
-            (
-                "subversions",
-                "Subversions",
-                filter_versions(subversions, info, info.subversions(v)),
-            )
-        )
-        if isinstance(info, PyPyVersionInfo):
-            data.append(
-                (
-                    "cpython_series",
-                    "CPython-Series",
-                    info.supported_cpython_series(
-                        v, released=subversions == "released"
-                    ),
-                )
-            )
-    elif isinstance(v, MinorVersion):
-        data.insert(1, ("level", "Level", "minor"))
-        if isinstance(info, CPythonVersionInfo):
-            data.append(("eol_date", "EOL-Date", info.eol_date(v)))
-            data.append(("is_eol", "Is-EOL", info.is_eol(v)))
-        data.append(
-            (
-                "subversions",
-                "Subversions",
-                filter_versions(subversions, info, info.subversions(v)),
-            )
-        )
-        if isinstance(info, PyPyVersionInfo):
-            data.append(
-                (
-                    "cpython_series",
-                    "CPython-Series",
-                    info.supported_cpython_series(
-                        v, released=subversions == "released"
-                    ),
-                )
-            )
-    else:
-        assert isinstance(v, MicroVersion)
-        data.insert(1, ("level", "Level", "micro"))
-        if isinstance(info, CPythonVersionInfo):
-            data.append(("eol_date", "EOL-Date", info.eol_date(v)))
-            data.append(("is_eol", "Is-EOL", info.is_eol(v)))
-        if isinstance(info, PyPyVersionInfo):
-            data.append(("cpython", "CPython", info.supported_cpython(v)))
     if do_json:
-        print(json.dumps({k: v for k, _, v in data}, indent=4, default=str))
+        json_data: dict[str, Any] = {}
+
+        collect_show_data(info, v, subversions, json_data.__setitem__)
+        click.echo(json.dumps(json_data, indent=4, default=str))
     else:
-        for _, label, val in data:
+        text_rows: list[tuple[str, Any]] = []
+
+        def emit_text(key: str, val: Any) -> None:
+            text_rows.append((LABELS[key], val))
+
+        collect_show_data(info, v, subversions, emit_text)
+        lines: list[str] = []
+        for label, val in text_rows:
             if isinstance(val, date):
                 val = str(val)
             elif isinstance(val, bool):
@@ -207,20 +173,49 @@ def show(
                 val = ", ".join(val)
             elif val is None:
                 val = "UNKNOWN"
-            print(f"{label}: {val}")
+            lines.append(f"{label}: {val}\n")
+        click.echo("".join(lines), nl=False)
 
 
-def is_not_eol(pyvinfo: CPythonVersionInfo, version: str) -> bool:
-    return not pyvinfo.is_eol(version)
+def collect_show_data(
+    info: VersionInfo,
+    v: MajorVersion | MinorVersion | MicroVersion,
+    subversions: str,
+    emit: Callable[[str, Any], None],
+) -> None:
+    """
+    Call ``emit(key, value)`` for each field of ``show``'s output, in output
+    order
+    """
+    emit("version", str(v))
+    emit("level", LEVELS[type(v)])
+    emit("release_date", info.release_date(v))
+    emit("is_released", info.is_released(v))
+    if isinstance(info, CPythonVersionInfo):
+        emit("is_supported", info.is_supported(v))
+        emit("eol_date", info.eol_date(v))
+        emit("is_eol", info.is_eol(v))
+    # The version classes are never subclassed, so an identity check on the
+    # type suffices here.
+    if type(v) is MicroVersion:
+        if isinstance(info, PyPyVersionInfo):
+            emit("cpython", info.supported_cpython(v))
+    else:
+        emit("subversions", filter_versions(subversions, info, info.subversions(v)))
+        if isinstance(info, PyPyVersionInfo):
+            emit(
+                "cpython_series",
+                info.supported_cpython_series(v, released=subversions == "released"),
+            )
 
 
-def yes(version: str) -> bool:  # noqa: U100
-    return True
+def is_not_eol(pyvinfo: CPythonVersionInfo, version: str) -> bool:
+    return not pyvinfo.is_eol(version)
 
 
 def filter_versions(mode: str, info: VersionInfo, versions: list[str]) -> list[str]:
     if mode == "all":
-        filterer = yes
+        return list(versions)
     elif mode == "released":
         filterer = info.is_released
     elif mode == "supported":
@@ -233,7 +228,7 @@ def filter_versions(mode: str, info: VersionInfo, versions: list[str]) -> list[s
         filterer = partial(is_not_eol, info)
     else:
         raise AssertionError(f"Unexpected mode: {mode!r}")  # pragma: no cover
-    return list(filter(filterer, versions))
+    return [v for v in versions if filterer(v)]
 
 
 if __name__ == "__main__":
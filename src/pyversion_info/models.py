@@ -0,0 +1,27 @@
+# This module is kept separate from `util` so that pydantic is only imported
+# once a version database is actually parsed.
+
+from __future__ import annotations
+from datetime import date, datetime
+from typing import Dict, List, Union
+from pydantic import BaseModel
+from .util import MicroVersion, MinorVersion
+
+# Union[bool, date] needs to have `bool` first so that True and False aren't
+# treated as the timestamps 1 and 0.
+
+
+class RawCPythonInfo(BaseModel):
+    release_dates: Dict[MicroVersion, Union[bool, date]]
+    eol_dates: Dict[MinorVersion, Union[bool, date]]
+
+
+class RawPyPyInfo(BaseModel):
+    release_dates: Dict[MicroVersion, Union[bool, date]]
+    cpython_versions: Dict[MicroVersion, List[MicroVersion]]
+
+
+class RawDatabase(BaseModel):
+    last_modified: datetime
+    cpython: RawCPythonInfo
+    pypy: RawPyPyInfo
@@ -1,19 +1,48 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from datetime import date, datetime
-import re
-from typing import Any, Dict, List, TypeVar, Union
-from pydantic import BaseModel, GetCoreSchemaHandler
-from pydantic_core import CoreSchema, core_schema
+from functools import lru_cache
+import json
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
 
 V = TypeVar("V", bound="Version")
 
 
+# `json_loads()` deserializes a JSON document (such as the version database)
+# using orjson if it's installed.
+
+try:
+    import orjson
+except ImportError:
+
+    def json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+else:
+
+    def json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+
 class Version(ABC):
+    # Concrete subclasses declare their attributes in `__slots__` so that
+    # instances don't carry a `__dict__`.  (The slots can't be declared here,
+    # as that would conflict with the instance layout of `str`.)
+    __slots__ = ()
+
+    # The components of the version as a tuple of ints, computed once at
+    # construction time so that comparisons don't rebuild it
+    _parts: tuple[int, ...]
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, _source_type: Any, handler: GetCoreSchemaHandler
     ) -> CoreSchema:
+        from pydantic_core import core_schema
+
         return core_schema.no_info_after_validator_function(cls, handler(str))
 
     @property
@@ -29,98 +58,100 @@ class Version(ABC):
 
     def __lt__(self, other: Any) -> bool:
         if isinstance(other, type(self)):
-            return self.parts < other.parts
+            return self._parts < other._parts
         else:
             return NotImplemented  # pragma: no cover
 
     def __le__(self, other: Any) -> bool:
         if isinstance(other, type(self)):
-            return self.parts <= other.parts
+            return self._parts <= other._parts
         else:
             return NotImplemented  # pragma: no cover
 
     def __gt__(self, other: Any) -> bool:
         if isinstance(other, type(self)):
-            return self.parts > other.parts
+            return self._parts > other._parts
         else:
             return NotImplemented  # pragma: no cover
 
     def __ge__(self, other: Any) -> bool:
         if isinstance(other, type(self)):
-            return self.parts >= other.parts
+            return self._parts >= other._parts
         else:
             return NotImplemented  # pragma: no cover
 
 
 class MajorVersion(Version, str):
+    __slots__ = ("x", "_parts")
+
+    _parts: tuple[int]
+
     def __init__(self, s: str) -> None:
-        if not re.fullmatch(r"(\d+)", s):
+        # `str.isdecimal()` accepts the same characters as regex `\d`
+        if not s.isdecimal():
             raise ValueError(f"Invalid major version: {s!r}")
         self.x = int(s)
+        self._parts = (self.x,)
 
     @property
     def parts(self) -> tuple[int]:
-        return (self.x,)
+        return self._parts
 
     @classmethod
+    @lru_cache(maxsize=2048)
     def construct(cls, x: int) -> MajorVersion:
         return cls(str(x))
 
 
 class MinorVersion(Version, str):
+    __slots__ = ("x", "y", "_parts")
+
+    _parts: tuple[int, int]
+
     def __init__(self, s: str) -> None:
-        if not re.fullmatch(r"(\d+)\.(\d+)", s):
+        x, sep, y = s.partition(".")
+        if not (sep and x.isdecimal() and y.isdecimal()):
             raise ValueError(f"Invalid minor version: {s!r}")
-        x, _, y = s.partition(".")
         self.x = int(x)
         self.y = int(y)
+        self._parts = (self.x, self.y)
 
     @property
     def parts(self) -> tuple[int, int]:
-        return (self.x, self.y)
+        return self._parts
 
     @classmethod
+    @lru_cache(maxsize=2048)
     def construct(cls, x: int, y: int) -> MinorVersion:
         return cls(f"{x}.{y}")
 
 
 class MicroVersion(Version, str):
+    __slots__ = ("x", "y", "z", "_parts", "_minor")
+
+    _parts: tuple[int, int, int]
+
     def __init__(self, s: str) -> None:
-        if not re.fullmatch(r"(\d+)\.(\d+)\.(\d+)", s):
+        x, sep1, rest = s.partition(".")
+        y, sep2, z = rest.partition(".")
+        # `z` can't contain a dot here, as it would then fail `isdecimal()`
+        if not (sep1 and sep2 and x.isdecimal() and y.isdecimal() and z.isdecimal()):
             raise ValueError(f"Invalid micro version: {s!r}")
-        x, y, z = s.split(".")
         self.x = int(x)
         self.y = int(y)
         self.z = int(z)
+        self._parts = (self.x, self.y, self.z)
+        self._minor = MinorVersion.construct(self.x, self.y)
 
     @property
     def parts(self) -> tuple[int, int, int]:
-        return (self.x, self.y, self.z)
+        return self._parts
 
     @classmethod
+    @lru_cache(maxsize=2048)
     def construct(cls, x: int, y: int, z: int) -> MicroVersion:
         return cls(f"{x}.{y}.{z}")
 
     @property
     def minor(self) -> MinorVersion:
-        return MinorVersion.construct(self.x, self.y)
-
-
-# Union[bool, date] needs to have `bool` first so that True and False aren't
-# treated as the timestamps 1 and 0.
-
-
-class RawCPythonInfo(BaseModel):
-    release_dates: Dict[MicroVersion, Union[bool, date]]
-    eol_dates: Dict[MinorVersion, Union[bool, date]]
-
-
-class RawPyPyInfo(BaseModel):
-    release_dates: Dict[MicroVersion, Union[bool, date]]
-    cpython_versions: Dict[MicroVersion, List[MicroVersion]]
-
-
-class RawDatabase(BaseModel):
-    last_modified: datetime
-    cpython: RawCPythonInfo
-    pypy: RawPyPyInfo
+        return self._minor
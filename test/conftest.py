@@ -1,10 +1,38 @@
+from __future__ import annotations
 from pathlib import Path
 import pytest
-from pyversion_info import VersionDatabase
+from pyversion_info import CPythonVersionInfo, PyPyVersionInfo, VersionDatabase
 
-DATA_FILE = Path(__file__).with_name("data") / "pyversion-info-data.json"
+DATA_FILE = (Path(__file__).with_name("data") / "pyversion-info-data.json").resolve()
 
 
 @pytest.fixture(scope="session")
 def version_database() -> VersionDatabase:
     return VersionDatabase.parse_file(DATA_FILE)
+
+
+@pytest.fixture(scope="session")
+def pyvinfo(version_database: VersionDatabase) -> CPythonVersionInfo:
+    return version_database.cpython
+
+
+@pytest.fixture(scope="session")
+def pypyinfo(version_database: VersionDatabase) -> PyPyVersionInfo:
+    return version_database.pypy
+
+
+@pytest.fixture
+def use_cached_database(
+    monkeypatch: pytest.MonkeyPatch, version_database: VersionDatabase
+) -> None:
+    # Make the CLI's `-d DATA_FILE` return the session's already-parsed
+    # database instead of re-reading & re-parsing the file on every invocation
+    real_parse_file = VersionDatabase.parse_file
+
+    def parse_file(filepath: str | Path) -> VersionDatabase:
+        if Path(filepath) == DATA_FILE:
+            return version_database
+        else:
+            return real_parse_file(filepath)  # pragma: no cover
+
+    monkeypatch.setattr(VersionDatabase, "parse_file", parse_file)
@@ -0,0 +1,82 @@
+"""Utilities shared by the test modules"""
+
+from __future__ import annotations
+from collections.abc import Callable, Iterator
+from datetime import date
+from functools import lru_cache
+import json
+from typing import Any
+from click.testing import CliRunner, Result
+import pytest
+import pyversion_info
+from pyversion_info.__main__ import main
+
+# `CliRunner.invoke()` sets up fresh stream isolation on each call, so a single
+# runner can be shared by all tests.
+RUNNER = CliRunner()
+
+
+def fixed_date(today: date) -> Callable[[], Iterator[None]]:
+    """
+    Return an autouse module-scoped fixture that makes the library's current
+    date ``today``.  Assign the result to a module-level name in a test module
+    to apply it.
+    """
+
+    @pytest.fixture(autouse=True, scope="module")
+    def use_fixed_date() -> Iterator[None]:
+        with pytest.MonkeyPatch.context() as m:
+            m.setattr(pyversion_info, "_today", lambda: today)
+            yield
+
+    return use_fixed_date
+
+
+@lru_cache(maxsize=None)
+def _run_cli(args: tuple[str, ...], _today: date) -> Result:
+    return RUNNER.invoke(main, list(args), catch_exceptions=False)
+
+
+def run_cli(*args: str) -> Result:
+    # `main` is deterministic given its arguments, the data file, and the
+    # current date, so results are memoized on those to avoid repeating
+    # identical invocations across test cases.
+    return _run_cli(args, pyversion_info._today())
+
+
+# The text labels of `show`'s output fields.  This is deliberately written out
+# independently of `pyversion_info.__main__.LABELS` so that an accidental
+# change to the CLI's output format makes the tests fail.
+HEADER_LABELS = {
+    "version": "Version",
+    "level": "Level",
+    "release_date": "Release-Date",
+    "is_released": "Is-Released",
+    "is_supported": "Is-Supported",
+    "eol_date": "EOL-Date",
+    "is_eol": "Is-EOL",
+    "subversions": "Subversions",
+    "cpython_series": "CPython-Series",
+    "cpython": "CPython",
+}
+
+
+def expected_headers(data: dict[str, Any]) -> str:
+    """
+    Render the JSON output of ``show`` as the corresponding text output
+    """
+    lines = []
+    for key, val in data.items():
+        if isinstance(val, bool):
+            val = "yes" if val else "no"
+        elif isinstance(val, list):
+            val = ", ".join(val)
+        elif val is None:
+            val = "UNKNOWN"
+        lines.append(f"{HEADER_LABELS[key]}: {val}\n")
+    return "".join(lines)
+
+
+def expected_json(data: dict[str, Any]) -> bytes:
+    """Serialize ``data`` the way ``show --json`` does"""
+    return (json.dumps(data, indent=4) + "\n").encode("utf-8")
@@ -1,1245 +1,374 @@
 from __future__ import annotations
-import json
+from collections.abc import Iterable, Sequence
+from datetime import date
 from pathlib import Path
-from traceback import format_exception
+from typing import Any
 import click
-from click.testing import CliRunner, Result
+from helpers import expected_headers, expected_json, fixed_date, run_cli
 import pytest
-from pytest_mock import MockerFixture
+import pyversion_info
 from pyversion_info.__main__ import main
+from pyversion_info.util import json_loads
 
-DATA_FILE = str(Path(__file__).with_name("data") / "pyversion-info-data.json")
+DATA_FILE = str(
+    (Path(__file__).with_name("data") / "pyversion-info-data.json").resolve()
+)
 
+pytestmark = [pytest.mark.cli, pytest.mark.usefixtures("use_cached_database")]
 
-@pytest.fixture(autouse=True)
-def use_fixed_date(mocker: MockerFixture) -> None:
-    # Mocking/monkeypatching just the `today()` method of `date` doesn't seem
-    # to be an option, and monkeypatching the `date` class with a custom class
-    # that just implements `today()` causes problems on PyPy.  Fortunately,
-    # both CPython and PyPy implement `date.today()` by calling `time.time()`,
-    # so we just need to mock that and hope the implementation never changes.
-    mocker.patch("time.time", return_value=1556052408)
-    # Time is now 2019-04-23T16:46:48-04:00.
+use_fixed_date = fixed_date(date(2019, 4, 23))
 
 
-def show_result(r: Result) -> str:
-    if r.exception is not None:
-        assert isinstance(r.exc_info, tuple)
-        return "".join(format_exception(*r.exc_info))
-    else:
-        return r.output
+# Micro version numbers in the test database, keyed by minor version
+MICRO_NUMBERS: dict[str, Iterable[int]] = {
+    "0.9": [0, 1, 2, 4, 5, 6, 8, 9],
+    "1.0": range(5),
+    "1.1": range(2),
+    "1.2": range(1),
+    "1.3": range(1),
+    "1.4": range(1),
+    "1.5": range(3),
+    "1.6": range(2),
+    "2.0": range(2),
+    "2.1": range(4),
+    "2.2": range(4),
+    "2.3": range(8),
+    "2.4": range(7),
+    "2.5": range(7),
+    "2.6": range(10),
+    "2.7": range(19),
+    "3.0": range(2),
+    "3.1": range(6),
+    "3.2": range(7),
+    "3.3": range(8),
+    "3.4": range(11),
+    "3.5": range(8),
+    "3.6": range(9),
+    "3.7": range(5),
+    "3.8": range(1),
+    "4.0": range(1),
+}
 
+ALL_MINOR = tuple(MICRO_NUMBERS)
+NOT_EOL_MINOR = ("2.7", "3.5", "3.6", "3.7", "3.8", "4.0")
+RELEASED_MINOR = ALL_MINOR[: ALL_MINOR.index("3.8")]
+SUPPORTED_MINOR = ("2.7", "3.5", "3.6", "3.7")
 
-@pytest.mark.parametrize(
-    "mode,versions",
-    [
-        ("--all", ["0", "1", "2", "3", "4"]),
-        ("--not-eol", ["2", "3", "4"]),
-        ("--released", ["0", "1", "2", "3"]),
-        ("--supported", ["2", "3"]),
-    ],
+ALL_MICRO = tuple(f"{m}.{n}" for m, ns in MICRO_NUMBERS.items() for n in ns)
+UNRELEASED_MICRO = {"2.7.17", "2.7.18", "3.7.4", "3.8.0", "4.0.0"}
+NOT_EOL_MICRO = tuple(v for v in ALL_MICRO if v.rpartition(".")[0] in NOT_EOL_MINOR)
+RELEASED_MICRO = tuple(v for v in ALL_MICRO if v not in UNRELEASED_MICRO)
+SUPPORTED_MICRO = tuple(
+    v for v in RELEASED_MICRO if v.rpartition(".")[0] in SUPPORTED_MINOR
 )
-def test_cmd_list_major(mode: str, versions: list[str]) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", mode, "major"])
-    assert r.exit_code == 0, show_result(r)
-    assert r.output == "".join(v + "\n" for v in versions)
-    if mode == "--released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "major"])
-        assert r.exit_code == 0, show_result(r)
-        assert r.output == "".join(v + "\n" for v in versions)
 
 
-@pytest.mark.parametrize(
-    "mode,versions",
-    [
-        (
-            "--all",
-            [
-                "0.9",
-                "1.0",
-                "1.1",
-                "1.2",
-                "1.3",
-                "1.4",
-                "1.5",
-                "1.6",
-                "2.0",
-                "2.1",
-                "2.2",
-                "2.3",
-                "2.4",
-                "2.5",
-                "2.6",
-                "2.7",
-                "3.0",
-                "3.1",
-                "3.2",
-                "3.3",
-                "3.4",
-                "3.5",
-                "3.6",
-                "3.7",
-                "3.8",
-                "4.0",
-            ],
-        ),
-        ("--not-eol", ["2.7", "3.5", "3.6", "3.7", "3.8", "4.0"]),
-        (
-            "--released",
-            [
-                "0.9",
-                "1.0",
-                "1.1",
-                "1.2",
-                "1.3",
-                "1.4",
-                "1.5",
-                "1.6",
-                "2.0",
-                "2.1",
-                "2.2",
-                "2.3",
-                "2.4",
-                "2.5",
-                "2.6",
-                "2.7",
-                "3.0",
-                "3.1",
-                "3.2",
-                "3.3",
-                "3.4",
-                "3.5",
-                "3.6",
-                "3.7",
-            ],
-        ),
-        ("--supported", ["2.7", "3.5", "3.6", "3.7"]),
-    ],
-)
-def test_cmd_list_minor(mode: str, versions: list[str]) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", mode, "minor"])
-    assert r.exit_code == 0, show_result(r)
-    assert r.output == "".join(v + "\n" for v in versions)
-    if mode == "--released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "minor"])
-        assert r.exit_code == 0, show_result(r)
-        assert r.output == "".join(v + "\n" for v in versions)
+ALL_MAJOR = ("0", "1", "2", "3", "4")
+NOT_EOL_MAJOR = ("2", "3", "4")
+RELEASED_MAJOR = ALL_MAJOR[:-1]
+SUPPORTED_MAJOR = ("2", "3")
 
 
-@pytest.mark.parametrize(
-    "mode,versions",
-    [
-        (
-            "--all",
-            [
-                "0.9.0",
-                "0.9.1",
-                "0.9.2",
-                "0.9.4",
-                "0.9.5",
-                "0.9.6",
-                "0.9.8",
-                "0.9.9",
-                "1.0.0",
-                "1.0.1",
-                "1.0.2",
-                "1.0.3",
-                "1.0.4",
-                "1.1.0",
-                "1.1.1",
-                "1.2.0",
-                "1.3.0",
-                "1.4.0",
-                "1.5.0",
-                "1.5.1",
-                "1.5.2",
-                "1.6.0",
-                "1.6.1",
-                "2.0.0",
-                "2.0.1",
-                "2.1.0",
-                "2.1.1",
-                "2.1.2",
-                "2.1.3",
-                "2.2.0",
-                "2.2.1",
-                "2.2.2",
-                "2.2.3",
-                "2.3.0",
-                "2.3.1",
-                "2.3.2",
-                "2.3.3",
-                "2.3.4",
-                "2.3.5",
-                "2.3.6",
-                "2.3.7",
-                "2.4.0",
-                "2.4.1",
-                "2.4.2",
-                "2.4.3",
-                "2.4.4",
-                "2.4.5",
-                "2.4.6",
-                "2.5.0",
-                "2.5.1",
-                "2.5.2",
-                "2.5.3",
-                "2.5.4",
-                "2.5.5",
-                "2.5.6",
-                "2.6.0",
-                "2.6.1",
-                "2.6.2",
-                "2.6.3",
-                "2.6.4",
-                "2.6.5",
-                "2.6.6",
-                "2.6.7",
-                "2.6.8",
-                "2.6.9",
-                "2.7.0",
-                "2.7.1",
-                "2.7.2",
-                "2.7.3",
-                "2.7.4",
-                "2.7.5",
-                "2.7.6",
-                "2.7.7",
-                "2.7.8",
-                "2.7.9",
-                "2.7.10",
-                "2.7.11",
-                "2.7.12",
-                "2.7.13",
-                "2.7.14",
-                "2.7.15",
-                "2.7.16",
-                "2.7.17",
-                "2.7.18",
-                "3.0.0",
-                "3.0.1",
-                "3.1.0",
-                "3.1.1",
-                "3.1.2",
-                "3.1.3",
-                "3.1.4",
-                "3.1.5",
-                "3.2.0",
-                "3.2.1",
-                "3.2.2",
-                "3.2.3",
-                "3.2.4",
-                "3.2.5",
-                "3.2.6",
-                "3.3.0",
-                "3.3.1",
-                "3.3.2",
-                "3.3.3",
-                "3.3.4",
-                "3.3.5",
-                "3.3.6",
-                "3.3.7",
-                "3.4.0",
-                "3.4.1",
-                "3.4.2",
-                "3.4.3",
-                "3.4.4",
-                "3.4.5",
-                "3.4.6",
-                "3.4.7",
-                "3.4.8",
-                "3.4.9",
-                "3.4.10",
-                "3.5.0",
-                "3.5.1",
-                "3.5.2",
-                "3.5.3",
-                "3.5.4",
-                "3.5.5",
-                "3.5.6",
-                "3.5.7",
-                "3.6.0",
-                "3.6.1",
-                "3.6.2",
-                "3.6.3",
-                "3.6.4",
-                "3.6.5",
-                "3.6.6",
-                "3.6.7",
-                "3.6.8",
-                "3.7.0",
-                "3.7.1",
-                "3.7.2",
-                "3.7.3",
-                "3.7.4",
-                "3.8.0",
-                "4.0.0",
-            ],
-        ),
-        (
-            "--not-eol",
-            [
-                "2.7.0",
-                "2.7.1",
-                "2.7.2",
-                "2.7.3",
-                "2.7.4",
-                "2.7.5",
-                "2.7.6",
-                "2.7.7",
-                "2.7.8",
-                "2.7.9",
-                "2.7.10",
-                "2.7.11",
-                "2.7.12",
-                "2.7.13",
-                "2.7.14",
-                "2.7.15",
-                "2.7.16",
-                "2.7.17",
-                "2.7.18",
-                "3.5.0",
-                "3.5.1",
-                "3.5.2",
-                "3.5.3",
-                "3.5.4",
-                "3.5.5",
-                "3.5.6",
-                "3.5.7",
-                "3.6.0",
-                "3.6.1",
-                "3.6.2",
-                "3.6.3",
-                "3.6.4",
-                "3.6.5",
-                "3.6.6",
-                "3.6.7",
-                "3.6.8",
-                "3.7.0",
-                "3.7.1",
-                "3.7.2",
-                "3.7.3",
-                "3.7.4",
-                "3.8.0",
-                "4.0.0",
-            ],
-        ),
-        (
-            "--released",
-            [
-                "0.9.0",
-                "0.9.1",
-                "0.9.2",
-                "0.9.4",
-                "0.9.5",
-                "0.9.6",
-                "0.9.8",
-                "0.9.9",
-                "1.0.0",
-                "1.0.1",
-                "1.0.2",
-                "1.0.3",
-                "1.0.4",
-                "1.1.0",
-                "1.1.1",
-                "1.2.0",
-                "1.3.0",
-                "1.4.0",
-                "1.5.0",
-                "1.5.1",
-                "1.5.2",
-                "1.6.0",
-                "1.6.1",
-                "2.0.0",
-                "2.0.1",
-                "2.1.0",
-                "2.1.1",
-                "2.1.2",
-                "2.1.3",
-                "2.2.0",
-                "2.2.1",
-                "2.2.2",
-                "2.2.3",
-                "2.3.0",
-                "2.3.1",
-                "2.3.2",
-                "2.3.3",
-                "2.3.4",
-                "2.3.5",
-                "2.3.6",
-                "2.3.7",
-                "2.4.0",
-                "2.4.1",
-                "2.4.2",
-                "2.4.3",
-                "2.4.4",
-                "2.4.5",
-                "2.4.6",
-                "2.5.0",
-                "2.5.1",
-                "2.5.2",
-                "2.5.3",
-                "2.5.4",
-                "2.5.5",
-                "2.5.6",
-                "2.6.0",
-                "2.6.1",
-                "2.6.2",
-                "2.6.3",
-                "2.6.4",
-                "2.6.5",
-                "2.6.6",
-                "2.6.7",
-                "2.6.8",
-                "2.6.9",
-                "2.7.0",
-                "2.7.1",
-                "2.7.2",
-                "2.7.3",
-                "2.7.4",
-                "2.7.5",
-                "2.7.6",
-                "2.7.7",
-                "2.7.8",
-                "2.7.9",
-                "2.7.10",
-                "2.7.11",
-                "2.7.12",
-                "2.7.13",
-                "2.7.14",
-                "2.7.15",
-                "2.7.16",
-                "3.0.0",
-                "3.0.1",
-                "3.1.0",
-                "3.1.1",
-                "3.1.2",
-                "3.1.3",
-                "3.1.4",
-                "3.1.5",
-                "3.2.0",
-                "3.2.1",
-                "3.2.2",
-                "3.2.3",
-                "3.2.4",
-                "3.2.5",
-                "3.2.6",
-                "3.3.0",
-                "3.3.1",
-                "3.3.2",
-                "3.3.3",
-                "3.3.4",
-                "3.3.5",
-                "3.3.6",
-                "3.3.7",
-                "3.4.0",
-                "3.4.1",
-                "3.4.2",
-                "3.4.3",
-                "3.4.4",
-                "3.4.5",
-                "3.4.6",
-                "3.4.7",
-                "3.4.8",
-                "3.4.9",
-                "3.4.10",
-                "3.5.0",
-                "3.5.1",
-                "3.5.2",
-                "3.5.3",
-                "3.5.4",
-                "3.5.5",
-                "3.5.6",
-                "3.5.7",
-                "3.6.0",
-                "3.6.1",
-                "3.6.2",
-                "3.6.3",
-                "3.6.4",
-                "3.6.5",
-                "3.6.6",
-                "3.6.7",
-                "3.6.8",
-                "3.7.0",
-                "3.7.1",
-                "3.7.2",
-                "3.7.3",
-            ],
-        ),
-        (
-            "--supported",
-            [
-                "2.7.0",
-                "2.7.1",
-                "2.7.2",
-                "2.7.3",
-                "2.7.4",
-                "2.7.5",
-                "2.7.6",
-                "2.7.7",
-                "2.7.8",
-                "2.7.9",
-                "2.7.10",
-                "2.7.11",
-                "2.7.12",
-                "2.7.13",
-                "2.7.14",
-                "2.7.15",
-                "2.7.16",
-                "3.5.0",
-                "3.5.1",
-                "3.5.2",
-                "3.5.3",
-                "3.5.4",
-                "3.5.5",
-                "3.5.6",
-                "3.5.7",
-                "3.6.0",
-                "3.6.1",
-                "3.6.2",
-                "3.6.3",
-                "3.6.4",
-                "3.6.5",
-                "3.6.6",
-                "3.6.7",
-                "3.6.8",
-                "3.7.0",
-                "3.7.1",
-                "3.7.2",
-                "3.7.3",
-            ],
-        ),
-    ],
+def list_output(versions: Sequence[str]) -> bytes:
+    text = "\n".join(versions) + "\n" if versions else ""
+    return text.encode("us-ascii")
+
+
+LIST_CASES = [
+    pytest.param(level, mode, list_output(versions), id=f"{level}{mode}")
+    for level, mode, versions in [
+        ("major", "--all", ALL_MAJOR),
+        ("major", "--not-eol", NOT_EOL_MAJOR),
+        ("major", "--released", RELEASED_MAJOR),
+        ("major", "--supported", SUPPORTED_MAJOR),
+        ("minor", "--all", ALL_MINOR),
+        ("minor", "--not-eol", NOT_EOL_MINOR),
+        ("minor", "--released", RELEASED_MINOR),
+        ("minor", "--supported", SUPPORTED_MINOR),
+        ("micro", "--all", ALL_MICRO),
+        ("micro", "--not-eol", NOT_EOL_MICRO),
+        ("micro", "--released", RELEASED_MICRO),
+        ("micro", "--supported", SUPPORTED_MICRO),
+    ]
+]
+
+
+@pytest.mark.parametrize("level,mode,expected", LIST_CASES)
+def test_cmd_list(level: str, mode: str, expected: bytes) -> None:
+    r = run_cli("-d", DATA_FILE, "list", mode, level)
+    assert r.exit_code == 0, r.output
+    assert r.stdout_bytes == expected
+
+
+RELEASED_OUTPUT = {
+    "major": list_output(RELEASED_MAJOR),
+    "minor": list_output(RELEASED_MINOR),
+    "micro": list_output(RELEASED_MICRO),
+}
+
+
+@pytest.mark.parametrize("level", list(RELEASED_OUTPUT))
+def test_cmd_list_default_is_released(level: str) -> None:
+    r = run_cli("-d", DATA_FILE, "list", level)
+    assert r.exit_code == 0, r.output
+    assert r.stdout_bytes == RELEASED_OUTPUT[level]
+
+
+# The fields of `show`'s output for each version other than "subversions"
+SHOW_FIELDS: dict[str, dict[str, Any]] = {
+    "1": {
+        "version": "1",
+        "level": "major",
+        "release_date": "1994-01-26",
+        "is_released": True,
+        "is_supported": False,
+        "eol_date": None,
+        "is_eol": True,
+    },
+    "2": {
+        "version": "2",
+        "level": "major",
+        "release_date": "2000-10-16",
+        "is_released": True,
+        "is_supported": True,
+        "eol_date": None,
+        "is_eol": False,
+    },
+    "2.5": {
+        "version": "2.5",
+        "level": "minor",
+        "release_date": "2006-09-19",
+        "is_released": True,
+        "is_supported": False,
+        "eol_date": None,
+        "is_eol": True,
+    },
+    "2.6": {
+        "version": "2.6",
+        "level": "minor",
+        "release_date": "2008-10-02",
+        "is_released": True,
+        "is_supported": False,
+        "eol_date": "2013-10-29",
+        "is_eol": True,
+    },
+    "2.7": {
+        "version": "2.7",
+        "level": "minor",
+        "release_date": "2010-07-03",
+        "is_released": True,
+        "is_supported": True,
+        "eol_date": "2020-01-01",
+        "is_eol": False,
+    },
+    "3": {
+        "version": "3",
+        "level": "major",
+        "release_date": "2008-12-03",
+        "is_released": True,
+        "is_supported": True,
+        "eol_date": None,
+        "is_eol": False,
+    },
+    "3.8": {
+        "version": "3.8",
+        "level": "minor",
+        "release_date": "2019-10-21",
+        "is_released": False,
+        "is_supported": False,
+        "eol_date": "2024-10-01",
+        "is_eol": False,
+    },
+}
+
+
+SHOW_CASES: tuple[tuple[str, str, list[str]], ...] = (
+    ("1", "released", ["1.0", "1.1", "1.2", "1.3", "1.4", "1.5", "1.6"]),
+    ("1", "all", ["1.0", "1.1", "1.2", "1.3", "1.4", "1.5", "1.6"]),
+    ("1", "supported", []),
+    ("1", "not-eol", []),
+    ("2", "released", ["2.0", "2.1", "2.2", "2.3", "2.4", "2.5", "2.6", "2.7"]),
+    ("2", "all", ["2.0", "2.1", "2.2", "2.3", "2.4", "2.5", "2.6", "2.7"]),
+    ("2", "supported", ["2.7"]),
+    ("2", "not-eol", ["2.7"]),
+    (
+        "2.5",
+        "released",
+        ["2.5.0", "2.5.1", "2.5.2", "2.5.3", "2.5.4", "2.5.5", "2.5.6"],
+    ),
+    (
+        "2.6",
+        "released",
+        [
+            "2.6.0",
+            "2.6.1",
+            "2.6.2",
+            "2.6.3",
+            "2.6.4",
+            "2.6.5",
+            "2.6.6",
+            "2.6.7",
+            "2.6.8",
+            "2.6.9",
+        ],
+    ),
+    (
+        "2.6",
+        "all",
+        [
+            "2.6.0",
+            "2.6.1",
+            "2.6.2",
+            "2.6.3",
+            "2.6.4",
+            "2.6.5",
+            "2.6.6",
+            "2.6.7",
+            "2.6.8",
+            "2.6.9",
+        ],
+    ),
+    ("2.6", "supported", []),
+    ("2.6", "not-eol", []),
+    (
+        "2.7",
+        "released",
+        [
+            "2.7.0",
+            "2.7.1",
+            "2.7.2",
+            "2.7.3",
+            "2.7.4",
+            "2.7.5",
+            "2.7.6",
+            "2.7.7",
+            "2.7.8",
+            "2.7.9",
+            "2.7.10",
+            "2.7.11",
+            "2.7.12",
+            "2.7.13",
+            "2.7.14",
+            "2.7.15",
+            "2.7.16",
+        ],
+    ),
+    ("3", "released", ["3.0", "3.1", "3.2", "3.3", "3.4", "3.5", "3.6", "3.7"]),
+    ("3", "all", ["3.0", "3.1", "3.2", "3.3", "3.4", "3.5", "3.6", "3.7", "3.8"]),
+    ("3", "not-eol", ["3.5", "3.6", "3.7", "3.8"]),
+    ("3", "supported", ["3.5", "3.6", "3.7"]),
+    ("3.8", "released", []),
+    ("3.8", "all", ["3.8.0"]),
+    ("3.8", "supported", []),
+    ("3.8", "not-eol", ["3.8.0"]),
 )
-def test_cmd_list_micro(mode: str, versions: list[str]) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", mode, "micro"])
-    assert r.exit_code == 0, show_result(r)
-    assert r.output == "".join(v + "\n" for v in versions)
-    if mode == "--released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "micro"])
-        assert r.exit_code == 0, show_result(r)
-        assert r.output == "".join(v + "\n" for v in versions)
 
 
 @pytest.mark.parametrize(
-    "version,subversions,data,headers",
-    [
-        (
-            "1",
-            "released",
-            {
-                "version": "1",
-                "level": "major",
-                "release_date": "1994-01-26",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": None,
-                "is_eol": True,
-                "subversions": ["1.0", "1.1", "1.2", "1.3", "1.4", "1.5", "1.6"],
-            },
-            (
-                "Version: 1\n"
-                "Level: major\n"
-                "Release-Date: 1994-01-26\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: yes\n"
-                "Subversions: 1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6\n"
-            ),
-        ),
-        (
-            "1",
-            "all",
-            {
-                "version": "1",
-                "level": "major",
-                "release_date": "1994-01-26",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": None,
-                "is_eol": True,
-                "subversions": ["1.0", "1.1", "1.2", "1.3", "1.4", "1.5", "1.6"],
-            },
-            (
-                "Version: 1\n"
-                "Level: major\n"
-                "Release-Date: 1994-01-26\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: yes\n"
-                "Subversions: 1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6\n"
-            ),
-        ),
-        (
-            "1",
-            "supported",
-            {
-                "version": "1",
-                "level": "major",
-                "release_date": "1994-01-26",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": None,
-                "is_eol": True,
-                "subversions": [],
-            },
-            (
-                "Version: 1\n"
-                "Level: major\n"
-                "Release-Date: 1994-01-26\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: yes\n"
-                "Subversions: \n"
-            ),
-        ),
-        (
-            "1",
-            "not-eol",
-            {
-                "version": "1",
-                "level": "major",
-                "release_date": "1994-01-26",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": None,
-                "is_eol": True,
-                "subversions": [],
-            },
-            (
-                "Version: 1\n"
-                "Level: major\n"
-                "Release-Date: 1994-01-26\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: yes\n"
-                "Subversions: \n"
-            ),
-        ),
-        (
-            "2",
-            "released",
-            {
-                "version": "2",
-                "level": "major",
-                "release_date": "2000-10-16",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": ["2.0", "2.1", "2.2", "2.3", "2.4", "2.5", "2.6", "2.7"],
-            },
-            (
-                "Version: 2\n"
-                "Level: major\n"
-                "Release-Date: 2000-10-16\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7\n"
-            ),
-        ),
-        (
-            "2",
-            "all",
-            {
-                "version": "2",
-                "level": "major",
-                "release_date": "2000-10-16",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": ["2.0", "2.1", "2.2", "2.3", "2.4", "2.5", "2.6", "2.7"],
-            },
-            (
-                "Version: 2\n"
-                "Level: major\n"
-                "Release-Date: 2000-10-16\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7\n"
-            ),
-        ),
-        (
-            "2",
-            "supported",
-            {
-                "version": "2",
-                "level": "major",
-                "release_date": "2000-10-16",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": ["2.7"],
-            },
-            (
-                "Version: 2\n"
-                "Level: major\n"
-                "Release-Date: 2000-10-16\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 2.7\n"
-            ),
-        ),
-        (
-            "2",
-            "not-eol",
-            {
-                "version": "2",
-                "level": "major",
-                "release_date": "2000-10-16",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": ["2.7"],
-            },
-            (
-                "Version: 2\n"
-                "Level: major\n"
-                "Release-Date: 2000-10-16\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 2.7\n"
-            ),
-        ),
-        (
-            "2.5",
-            "released",
-            {
-                "version": "2.5",
-                "level": "minor",
-                "release_date": "2006-09-19",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": None,
-                "is_eol": True,
-                "subversions": [
-                    "2.5.0",
-                    "2.5.1",
-                    "2.5.2",
-                    "2.5.3",
-                    "2.5.4",
-                    "2.5.5",
-                    "2.5.6",
-                ],
-            },
-            (
-                "Version: 2.5\n"
-                "Level: minor\n"
-                "Release-Date: 2006-09-19\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: yes\n"
-                "Subversions: 2.5.0, 2.5.1, 2.5.2, 2.5.3, 2.5.4, 2.5.5, 2.5.6\n"
-            ),
-        ),
-        (
-            "2.6",
-            "released",
-            {
-                "version": "2.6",
-                "level": "minor",
-                "release_date": "2008-10-02",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": "2013-10-29",
-                "is_eol": True,
-                "subversions": [
-                    "2.6.0",
-                    "2.6.1",
-                    "2.6.2",
-                    "2.6.3",
-                    "2.6.4",
-                    "2.6.5",
-                    "2.6.6",
-                    "2.6.7",
-                    "2.6.8",
-                    "2.6.9",
-                ],
-            },
-            (
-                "Version: 2.6\n"
-                "Level: minor\n"
-                "Release-Date: 2008-10-02\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2013-10-29\n"
-                "Is-EOL: yes\n"
-                "Subversions: 2.6.0, 2.6.1, 2.6.2, 2.6.3, 2.6.4, 2.6.5, 2.6.6,"
-                " 2.6.7, 2.6.8, 2.6.9\n"
-            ),
-        ),
-        (
-            "2.6",
-            "all",
-            {
-                "version": "2.6",
-                "level": "minor",
-                "release_date": "2008-10-02",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": "2013-10-29",
-                "is_eol": True,
-                "subversions": [
-                    "2.6.0",
-                    "2.6.1",
-                    "2.6.2",
-                    "2.6.3",
-                    "2.6.4",
-                    "2.6.5",
-                    "2.6.6",
-                    "2.6.7",
-                    "2.6.8",
-                    "2.6.9",
-                ],
-            },
-            (
-                "Version: 2.6\n"
-                "Level: minor\n"
-                "Release-Date: 2008-10-02\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2013-10-29\n"
-                "Is-EOL: yes\n"
-                "Subversions: 2.6.0, 2.6.1, 2.6.2, 2.6.3, 2.6.4, 2.6.5, 2.6.6,"
-                " 2.6.7, 2.6.8, 2.6.9\n"
-            ),
-        ),
-        (
-            "2.6",
-            "supported",
-            {
-                "version": "2.6",
-                "level": "minor",
-                "release_date": "2008-10-02",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": "2013-10-29",
-                "is_eol": True,
-                "subversions": [],
-            },
-            (
-                "Version: 2.6\n"
-                "Level: minor\n"
-                "Release-Date: 2008-10-02\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2013-10-29\n"
-                "Is-EOL: yes\n"
-                "Subversions: \n"
-            ),
-        ),
-        (
-            "2.6",
-            "not-eol",
-            {
-                "version": "2.6",
-                "level": "minor",
-                "release_date": "2008-10-02",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": "2013-10-29",
-                "is_eol": True,
-                "subversions": [],
-            },
-            (
-                "Version: 2.6\n"
-                "Level: minor\n"
-                "Release-Date: 2008-10-02\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2013-10-29\n"
-                "Is-EOL: yes\n"
-                "Subversions: \n"
-            ),
-        ),
-        (
-            "2.7",
-            "released",
-            {
-                "version": "2.7",
-                "level": "minor",
-                "release_date": "2010-07-03",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": "2020-01-01",
-                "is_eol": False,
-                "subversions": [
-                    "2.7.0",
-                    "2.7.1",
-                    "2.7.2",
-                    "2.7.3",
-                    "2.7.4",
-                    "2.7.5",
-                    "2.7.6",
-                    "2.7.7",
-                    "2.7.8",
-                    "2.7.9",
-                    "2.7.10",
-                    "2.7.11",
-                    "2.7.12",
-                    "2.7.13",
-                    "2.7.14",
-                    "2.7.15",
-                    "2.7.16",
-                ],
-            },
-            (
-                "Version: 2.7\n"
-                "Level: minor\n"
-                "Release-Date: 2010-07-03\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: 2020-01-01\n"
-                "Is-EOL: no\n"
-                "Subversions: 2.7.0, 2.7.1, 2.7.2, 2.7.3, 2.7.4, 2.7.5, 2.7.6,"
-                " 2.7.7, 2.7.8, 2.7.9, 2.7.10, 2.7.11, 2.7.12, 2.7.13, 2.7.14,"
-                " 2.7.15, 2.7.16\n"
-            ),
-        ),
-        (
-            "3",
-            "released",
-            {
-                "version": "3",
-                "level": "major",
-                "release_date": "2008-12-03",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": ["3.0", "3.1", "3.2", "3.3", "3.4", "3.5", "3.6", "3.7"],
-            },
-            (
-                "Version: 3\n"
-                "Level: major\n"
-                "Release-Date: 2008-12-03\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 3.0, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7\n"
-            ),
-        ),
-        (
-            "3",
-            "all",
-            {
-                "version": "3",
-                "level": "major",
-                "release_date": "2008-12-03",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": [
-                    "3.0",
-                    "3.1",
-                    "3.2",
-                    "3.3",
-                    "3.4",
-                    "3.5",
-                    "3.6",
-                    "3.7",
-                    "3.8",
-                ],
-            },
-            (
-                "Version: 3\n"
-                "Level: major\n"
-                "Release-Date: 2008-12-03\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 3.0, 3.1, 3.2, 3.3, 3.4, 3.5, 3.6, 3.7, 3.8\n"
-            ),
-        ),
-        (
-            "3",
-            "not-eol",
-            {
-                "version": "3",
-                "level": "major",
-                "release_date": "2008-12-03",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": ["3.5", "3.6", "3.7", "3.8"],
-            },
-            (
-                "Version: 3\n"
-                "Level: major\n"
-                "Release-Date: 2008-12-03\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 3.5, 3.6, 3.7, 3.8\n"
-            ),
-        ),
-        (
-            "3",
-            "supported",
-            {
-                "version": "3",
-                "level": "major",
-                "release_date": "2008-12-03",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": None,
-                "is_eol": False,
-                "subversions": ["3.5", "3.6", "3.7"],
-            },
-            (
-                "Version: 3\n"
-                "Level: major\n"
-                "Release-Date: 2008-12-03\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: no\n"
-                "Subversions: 3.5, 3.6, 3.7\n"
-            ),
-        ),
-        (
-            "3.8",
-            "released",
-            {
-                "version": "3.8",
-                "level": "minor",
-                "release_date": "2019-10-21",
-                "is_released": False,
-                "is_supported": False,
-                "eol_date": "2024-10-01",
-                "is_eol": False,
-                "subversions": [],
-            },
-            (
-                "Version: 3.8\n"
-                "Level: minor\n"
-                "Release-Date: 2019-10-21\n"
-                "Is-Released: no\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2024-10-01\n"
-                "Is-EOL: no\n"
-                "Subversions: \n"
-            ),
-        ),
-        (
-            "3.8",
-            "all",
-            {
-                "version": "3.8",
-                "level": "minor",
-                "release_date": "2019-10-21",
-                "is_released": False,
-                "is_supported": False,
-                "eol_date": "2024-10-01",
-                "is_eol": False,
-                "subversions": ["3.8.0"],
-            },
-            (
-                "Version: 3.8\n"
-                "Level: minor\n"
-                "Release-Date: 2019-10-21\n"
-                "Is-Released: no\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2024-10-01\n"
-                "Is-EOL: no\n"
-                "Subversions: 3.8.0\n"
-            ),
-        ),
-        (
-            "3.8",
-            "supported",
-            {
-                "version": "3.8",
-                "level": "minor",
-                "release_date": "2019-10-21",
-                "is_released": False,
-                "is_supported": False,
-                "eol_date": "2024-10-01",
-                "is_eol": False,
-                "subversions": [],
-            },
-            (
-                "Version: 3.8\n"
-                "Level: minor\n"
-                "Release-Date: 2019-10-21\n"
-                "Is-Released: no\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2024-10-01\n"
-                "Is-EOL: no\n"
-                "Subversions: \n"
-            ),
-        ),
-        (
-            "3.8",
-            "not-eol",
-            {
-                "version": "3.8",
-                "level": "minor",
-                "release_date": "2019-10-21",
-                "is_released": False,
-                "is_supported": False,
-                "eol_date": "2024-10-01",
-                "is_eol": False,
-                "subversions": ["3.8.0"],
-            },
-            (
-                "Version: 3.8\n"
-                "Level: minor\n"
-                "Release-Date: 2019-10-21\n"
-                "Is-Released: no\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2024-10-01\n"
-                "Is-EOL: no\n"
-                "Subversions: 3.8.0\n"
-            ),
-        ),
-    ],
+    "version,subversions,subversion_list",
+    SHOW_CASES,
+    ids=[f"{v}-{s}" for v, s, _ in SHOW_CASES],
 )
-def test_show(version: str, subversions: str, data: dict, headers: str) -> None:
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--subversions", subversions, version]
-    )
-    assert r.exit_code == 0, show_result(r)
+def test_show(version: str, subversions: str, subversion_list: list[str]) -> None:
+    data = {**SHOW_FIELDS[version], "subversions": subversion_list}
+    headers = expected_headers(data)
+    r = run_cli("-d", DATA_FILE, "show", "--subversions", subversions, version)
+    assert r.exit_code == 0, r.output
     assert r.output == headers
     if subversions == "released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "show", version])
-        assert r.exit_code == 0, show_result(r)
+        r = run_cli("-d", DATA_FILE, "show", version)
+        assert r.exit_code == 0, r.output
         assert r.output == headers
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--json", "--subversions", subversions, version]
+    r = run_cli(
+        "-d", DATA_FILE, "show", "--json", "--subversions", subversions, version
     )
-    assert r.exit_code == 0, show_result(r)
-    assert json.loads(r.output) == data
+    assert r.exit_code == 0, r.output
+    assert r.stdout_bytes == expected_json(data)
+
+
+SHOW_MICRO_CASES = (
+    (
+        "0.9.2",
+        {
+            "version": "0.9.2",
+            "level": "micro",
+            "release_date": None,
+            "is_released": True,
+            "is_supported": False,
+            "eol_date": None,
+            "is_eol": True,
+        },
+    ),
+    (
+        "3.3.2",
+        {
+            "version": "3.3.2",
+            "level": "micro",
+            "release_date": "2013-05-15",
+            "is_released": True,
+            "is_supported": False,
+            "eol_date": "2017-09-29",
+            "is_eol": True,
+        },
+    ),
+    (
+        "3.6.1",
+        {
+            "version": "3.6.1",
+            "level": "micro",
+            "release_date": "2017-03-21",
+            "is_released": True,
+            "is_supported": True,
+            "eol_date": "2021-12-23",
+            "is_eol": False,
+        },
+    ),
+    (
+        "3.7.4",
+        {
+            "version": "3.7.4",
+            "level": "micro",
+            "release_date": "2019-06-24",
+            "is_released": False,
+            "is_supported": False,
+            "eol_date": "2023-06-27",
+            "is_eol": False,
+        },
+    ),
+)
 
 
 @pytest.mark.parametrize(
-    "version,data,headers",
-    [
-        (
-            "0.9.2",
-            {
-                "version": "0.9.2",
-                "level": "micro",
-                "release_date": None,
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": None,
-                "is_eol": True,
-            },
-            (
-                "Version: 0.9.2\n"
-                "Level: micro\n"
-                "Release-Date: UNKNOWN\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: UNKNOWN\n"
-                "Is-EOL: yes\n"
-            ),
-        ),
-        (
-            "3.3.2",
-            {
-                "version": "3.3.2",
-                "level": "micro",
-                "release_date": "2013-05-15",
-                "is_released": True,
-                "is_supported": False,
-                "eol_date": "2017-09-29",
-                "is_eol": True,
-            },
-            (
-                "Version: 3.3.2\n"
-                "Level: micro\n"
-                "Release-Date: 2013-05-15\n"
-                "Is-Released: yes\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2017-09-29\n"
-                "Is-EOL: yes\n"
-            ),
-        ),
-        (
-            "3.6.1",
-            {
-                "version": "3.6.1",
-                "level": "micro",
-                "release_date": "2017-03-21",
-                "is_released": True,
-                "is_supported": True,
-                "eol_date": "2021-12-23",
-                "is_eol": False,
-            },
-            (
-                "Version: 3.6.1\n"
-                "Level: micro\n"
-                "Release-Date: 2017-03-21\n"
-                "Is-Released: yes\n"
-                "Is-Supported: yes\n"
-                "EOL-Date: 2021-12-23\n"
-                "Is-EOL: no\n"
-            ),
-        ),
-        (
-            "3.7.4",
-            {
-                "version": "3.7.4",
-                "level": "micro",
-                "release_date": "2019-06-24",
-                "is_released": False,
-                "is_supported": False,
-                "eol_date": "2023-06-27",
-                "is_eol": False,
-            },
-            (
-                "Version: 3.7.4\n"
-                "Level: micro\n"
-                "Release-Date: 2019-06-24\n"
-                "Is-Released: no\n"
-                "Is-Supported: no\n"
-                "EOL-Date: 2023-06-27\n"
-                "Is-EOL: no\n"
-            ),
-        ),
-    ],
+    "version,data", SHOW_MICRO_CASES, ids=[v for v, _ in SHOW_MICRO_CASES]
 )
+@pytest.mark.parametrize("as_json", [False, True], ids=["text", "json"])
+def test_show_micro(version: str, data: dict, as_json: bool) -> None:
+    args = ["-d", DATA_FILE, "show"]
+    if as_json:
+        args.append("--json")
+    r = run_cli(*args, version)
+    assert r.exit_code == 0, r.output
+    if as_json:
+        assert r.stdout_bytes == expected_json(data)
+    else:
+        assert r.output == expected_headers(data)
+
+
 @pytest.mark.parametrize("subversions", ["released", "all", "supported", "not-eol"])
-def test_show_micro(version: str, subversions: str, data: dict, headers: str) -> None:
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--subversions", subversions, version]
-    )
-    assert r.exit_code == 0, show_result(r)
-    assert r.output == headers
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--json", "--subversions", subversions, version]
-    )
-    assert r.exit_code == 0, show_result(r)
-    assert json.loads(r.output) == data
+def test_show_micro_ignores_subversions(subversions: str) -> None:
+    # `--subversions` has no effect on the output for micro versions, so
+    # test_show_micro only needs to check the default
+    r = run_cli("-d", DATA_FILE, "show", "--subversions", subversions, "3.6.1")
+    assert r.exit_code == 0, r.output
+    default = run_cli("-d", DATA_FILE, "show", "3.6.1")
+    assert default.exit_code == 0, default.output
+    assert r.output == default.output
 
 
-def test_show_recent(mocker: MockerFixture) -> None:
-    mocker.patch("time.time", return_value=1635992101)
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "show", "2"])
-    assert r.exit_code == 0, show_result(r)
+def test_show_recent(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pyversion_info, "_today", lambda: date(2021, 11, 3))
+    r = run_cli("-d", DATA_FILE, "show", "2")
+    assert r.exit_code == 0, r.output
     assert r.output == (
         "Version: 2\n"
         "Level: major\n"
@@ -1250,9 +379,9 @@ def test_show_recent(mocker: MockerFixture) -> None:
         "Is-EOL: yes\n"
         "Subversions: 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7\n"
     )
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "show", "--json", "2"])
-    assert r.exit_code == 0, show_result(r)
-    assert json.loads(r.output) == {
+    r = run_cli("-d", DATA_FILE, "show", "--json", "2")
+    assert r.exit_code == 0, r.output
+    assert json_loads(r.stdout_bytes) == {
         "version": "2",
         "level": "major",
         "release_date": "2000-10-16",
@@ -1264,17 +393,26 @@ def test_show_recent(mocker: MockerFixture) -> None:
     }
 
 
-@pytest.mark.parametrize("v", ["", "1.2.3.4", "1.2.3rc1", "foobar", "a.b.c"])
-def test_show_invalid_version(v: str) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "show", v], standalone_mode=False)
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == f"Invalid version string: {v!r}"
-
-
-@pytest.mark.parametrize("v", ["0.8", "2.5.7", "3.9", "3.9.0", "5"])
-def test_show_unknown_version(v: str) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "show", v], standalone_mode=False)
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == f"Unknown version: {v!r}"
+@pytest.mark.parametrize(
+    "v,expected",
+    [
+        ("", "Invalid version string: ''"),
+        ("1.2.3.4", "Invalid version string: '1.2.3.4'"),
+        ("1.2.3rc1", "Invalid version string: '1.2.3rc1'"),
+        ("foobar", "Invalid version string: 'foobar'"),
+        ("a.b.c", "Invalid version string: 'a.b.c'"),
+        ("0.8", "Unknown version: '0.8'"),
+        ("2.5.7", "Unknown version: '2.5.7'"),
+        ("3.9", "Unknown version: '3.9'"),
+        ("3.9.0", "Unknown version: '3.9.0'"),
+        ("5", "Unknown version: '5'"),
+    ],
+)
+def test_show_version_error(v: str, expected: str) -> None:
+    with pytest.raises(click.UsageError) as excinfo:
+        main.main(
+            ["-d", DATA_FILE, "show", v],
+            prog_name="pyversion-info",
+            standalone_mode=False,
+        )
+    assert str(excinfo.value) == expected
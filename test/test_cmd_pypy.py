@@ -1,48 +1,23 @@
 from __future__ import annotations
-import json
+from collections.abc import Sequence
+from datetime import date
 from pathlib import Path
-from traceback import format_exception
+from typing import Any
 import click
-from click.testing import CliRunner, Result
+from helpers import expected_headers, expected_json, fixed_date, run_cli
 import pytest
-from pytest_mock import MockerFixture
 from pyversion_info.__main__ import main
 
-DATA_FILE = str(Path(__file__).with_name("data") / "pyversion-info-data.json")
-
-
-@pytest.fixture(autouse=True)
-def use_fixed_date(mocker: MockerFixture) -> None:
-    mocker.patch("time.time", return_value=1635992101)
-    # Time is now 2021-11-04T02:15:01+00:00.
+DATA_FILE = str(
+    (Path(__file__).with_name("data") / "pyversion-info-data.json").resolve()
+)
 
+pytestmark = [pytest.mark.cli, pytest.mark.usefixtures("use_cached_database")]
 
-def show_result(r: Result) -> str:
-    if r.exception is not None:
-        assert isinstance(r.exc_info, tuple)
-        return "".join(format_exception(*r.exc_info))
-    else:
-        return r.output
+use_fixed_date = fixed_date(date(2021, 11, 3))
 
 
-@pytest.mark.parametrize(
-    "mode,versions",
-    [
-        ("--all", ["1", "2", "4", "5", "6", "7", "8"]),
-        ("--released", ["1", "2", "4", "5", "6", "7"]),
-    ],
-)
-def test_cmd_list_major(mode: str, versions: list[str]) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "--pypy", mode, "major"])
-    assert r.exit_code == 0, show_result(r)
-    assert r.output == "".join(v + "\n" for v in versions)
-    if mode == "--released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "--pypy", "major"])
-        assert r.exit_code == 0, show_result(r)
-        assert r.output == "".join(v + "\n" for v in versions)
-
-
-RELEASED_MINOR = [
+RELEASED_MINOR = (
     "1.6",
     "1.7",
     "1.8",
@@ -69,27 +44,10 @@ RELEASED_MINOR = [
     "7.1",
     "7.2",
     "7.3",
-]
-
-
-@pytest.mark.parametrize(
-    "mode,versions",
-    [
-        ("--all", RELEASED_MINOR + ["7.4", "8.0"]),
-        ("--released", RELEASED_MINOR),
-    ],
 )
-def test_cmd_list_minor(mode: str, versions: list[str]) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "--pypy", mode, "minor"])
-    assert r.exit_code == 0, show_result(r)
-    assert r.output == "".join(v + "\n" for v in versions)
-    if mode == "--released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "--pypy", "minor"])
-        assert r.exit_code == 0, show_result(r)
-        assert r.output == "".join(v + "\n" for v in versions)
 
 
-RELEASED_MICRO = [
+RELEASED_MICRO = (
     "1.6.0",
     "1.7.0",
     "1.8.0",
@@ -138,323 +96,280 @@ RELEASED_MICRO = [
     "7.3.5",
     "7.3.6",
     "7.3.7",
+)
+
+
+RELEASED_MAJOR = ("1", "2", "4", "5", "6", "7")
+ALL_MAJOR = RELEASED_MAJOR + ("8",)
+ALL_MINOR = RELEASED_MINOR + ("7.4", "8.0")
+ALL_MICRO = RELEASED_MICRO + ("7.4.0", "8.0.0")
+
+
+def list_output(versions: Sequence[str]) -> bytes:
+    text = "\n".join(versions) + "\n" if versions else ""
+    return text.encode("us-ascii")
+
+
+LIST_CASES = [
+    pytest.param(level, mode, list_output(versions), id=f"{level}{mode}")
+    for level, mode, versions in [
+        ("major", "--all", ALL_MAJOR),
+        ("major", "--released", RELEASED_MAJOR),
+        ("minor", "--all", ALL_MINOR),
+        ("minor", "--released", RELEASED_MINOR),
+        ("micro", "--all", ALL_MICRO),
+        ("micro", "--released", RELEASED_MICRO),
+    ]
 ]
 
 
-@pytest.mark.parametrize(
-    "mode,versions",
-    [
-        ("--all", RELEASED_MICRO + ["7.4.0", "8.0.0"]),
-        ("--released", RELEASED_MICRO),
-    ],
-)
-def test_cmd_list_micro(mode: str, versions: list[str]) -> None:
-    r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "--pypy", mode, "micro"])
-    assert r.exit_code == 0, show_result(r)
-    assert r.output == "".join(v + "\n" for v in versions)
-    if mode == "--released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "list", "--pypy", "micro"])
-        assert r.exit_code == 0, show_result(r)
-        assert r.output == "".join(v + "\n" for v in versions)
+@pytest.mark.parametrize("level,mode,expected", LIST_CASES)
+def test_cmd_list(level: str, mode: str, expected: bytes) -> None:
+    r = run_cli("-d", DATA_FILE, "list", "--pypy", mode, level)
+    assert r.exit_code == 0, r.output
+    assert r.stdout_bytes == expected
+
+
+RELEASED_OUTPUT = {
+    "major": list_output(RELEASED_MAJOR),
+    "minor": list_output(RELEASED_MINOR),
+    "micro": list_output(RELEASED_MICRO),
+}
+
+
+@pytest.mark.parametrize("level", list(RELEASED_OUTPUT))
+def test_cmd_list_default_is_released(level: str) -> None:
+    r = run_cli("-d", DATA_FILE, "list", "--pypy", level)
+    assert r.exit_code == 0, r.output
+    assert r.stdout_bytes == RELEASED_OUTPUT[level]
 
 
 @pytest.mark.parametrize("level", ["major", "minor", "micro"])
 def test_cmd_list_not_eol(level: str) -> None:
-    r = CliRunner().invoke(
-        main,
-        ["-d", DATA_FILE, "list", "--pypy", "--not-eol", level],
-        standalone_mode=False,
-    )
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == "'not-eol' only applies to CPython versions"
+    with pytest.raises(click.UsageError) as excinfo:
+        main.main(
+            ["-d", DATA_FILE, "list", "--pypy", "--not-eol", level],
+            prog_name="pyversion-info",
+            standalone_mode=False,
+        )
+    assert str(excinfo.value) == "'not-eol' only applies to CPython versions"
 
 
 @pytest.mark.parametrize("level", ["major", "minor", "micro"])
 def test_cmd_list_supported(level: str) -> None:
-    r = CliRunner().invoke(
-        main,
-        ["-d", DATA_FILE, "list", "--pypy", "--supported", level],
-        standalone_mode=False,
-    )
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == "'supported' only applies to CPython versions"
+    with pytest.raises(click.UsageError) as excinfo:
+        main.main(
+            ["-d", DATA_FILE, "list", "--pypy", "--supported", level],
+            prog_name="pyversion-info",
+            standalone_mode=False,
+        )
+    assert str(excinfo.value) == "'supported' only applies to CPython versions"
 
 
-@pytest.mark.parametrize(
-    "version,data,headers",
-    [
-        (
-            "1",
-            {
-                "version": "1",
-                "level": "major",
-                "release_date": "2011-08-18",
-                "is_released": True,
-                "subversions": ["1.6", "1.7", "1.8", "1.9"],
-                "cpython_series": ["2.7"],
-            },
-            (
-                "Version: 1\n"
-                "Level: major\n"
-                "Release-Date: 2011-08-18\n"
-                "Is-Released: yes\n"
-                "Subversions: 1.6, 1.7, 1.8, 1.9\n"
-                "CPython-Series: 2.7\n"
-            ),
-        ),
-        (
-            "2",
-            {
-                "version": "2",
-                "level": "major",
-                "release_date": "2013-05-09",
-                "is_released": True,
-                "subversions": ["2.0", "2.1", "2.2", "2.3", "2.4", "2.5", "2.6"],
-                "cpython_series": ["2.7", "3.2"],
-            },
-            (
-                "Version: 2\n"
-                "Level: major\n"
-                "Release-Date: 2013-05-09\n"
-                "Is-Released: yes\n"
-                "Subversions: 2.0, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6\n"
-                "CPython-Series: 2.7, 3.2\n"
-            ),
-        ),
-        (
-            "2.5",
-            {
-                "version": "2.5",
-                "level": "minor",
-                "release_date": "2015-02-03",
-                "is_released": True,
-                "subversions": ["2.5.0", "2.5.1"],
-                "cpython_series": ["2.7"],
-            },
-            (
-                "Version: 2.5\n"
-                "Level: minor\n"
-                "Release-Date: 2015-02-03\n"
-                "Is-Released: yes\n"
-                "Subversions: 2.5.0, 2.5.1\n"
-                "CPython-Series: 2.7\n"
-            ),
-        ),
-        (
-            "7.3.7",
-            {
-                "version": "7.3.7",
-                "level": "micro",
-                "release_date": "2021-10-25",
-                "is_released": True,
-                "cpython": ["3.7.12", "3.8.12"],
-            },
-            (
-                "Version: 7.3.7\n"
-                "Level: micro\n"
-                "Release-Date: 2021-10-25\n"
-                "Is-Released: yes\n"
-                "CPython: 3.7.12, 3.8.12\n"
-            ),
-        ),
-        (
-            "8.0.0",
-            {
-                "version": "8.0.0",
-                "level": "micro",
-                "release_date": None,
-                "is_released": False,
-                "cpython": ["3.11.1"],
-            },
-            (
-                "Version: 8.0.0\n"
-                "Level: micro\n"
-                "Release-Date: UNKNOWN\n"
-                "Is-Released: no\n"
-                "CPython: 3.11.1\n"
-            ),
-        ),
-    ],
+SHOW_CASES = (
+    (
+        "1",
+        {
+            "version": "1",
+            "level": "major",
+            "release_date": "2011-08-18",
+            "is_released": True,
+            "subversions": ["1.6", "1.7", "1.8", "1.9"],
+            "cpython_series": ["2.7"],
+        },
+    ),
+    (
+        "2",
+        {
+            "version": "2",
+            "level": "major",
+            "release_date": "2013-05-09",
+            "is_released": True,
+            "subversions": ["2.0", "2.1", "2.2", "2.3", "2.4", "2.5", "2.6"],
+            "cpython_series": ["2.7", "3.2"],
+        },
+    ),
+    (
+        "2.5",
+        {
+            "version": "2.5",
+            "level": "minor",
+            "release_date": "2015-02-03",
+            "is_released": True,
+            "subversions": ["2.5.0", "2.5.1"],
+            "cpython_series": ["2.7"],
+        },
+    ),
+    (
+        "7.3.7",
+        {
+            "version": "7.3.7",
+            "level": "micro",
+            "release_date": "2021-10-25",
+            "is_released": True,
+            "cpython": ["3.7.12", "3.8.12"],
+        },
+    ),
+    (
+        "8.0.0",
+        {
+            "version": "8.0.0",
+            "level": "micro",
+            "release_date": None,
+            "is_released": False,
+            "cpython": ["3.11.1"],
+        },
+    ),
 )
+
+
+@pytest.mark.parametrize("version,data", SHOW_CASES, ids=[v for v, _ in SHOW_CASES])
 @pytest.mark.parametrize("subversions", ["released", "all"])
-def test_show(version: str, subversions: str, data: dict, headers: str) -> None:
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--pypy", "--subversions", subversions, version]
+def test_show(version: str, subversions: str, data: dict) -> None:
+    headers = expected_headers(data)
+    r = run_cli(
+        "-d", DATA_FILE, "show", "--pypy", "--subversions", subversions, version
     )
-    assert r.exit_code == 0, show_result(r)
+    assert r.exit_code == 0, r.output
     assert r.output == headers
-    r = CliRunner().invoke(
-        main,
-        [
-            "-d",
-            DATA_FILE,
-            "show",
-            "--pypy",
-            "--json",
-            "--subversions",
-            subversions,
-            version,
-        ],
+    r = run_cli(
+        "-d",
+        DATA_FILE,
+        "show",
+        "--pypy",
+        "--json",
+        "--subversions",
+        subversions,
+        version,
     )
-    assert r.exit_code == 0, show_result(r)
-    assert json.loads(r.output) == data
+    assert r.exit_code == 0, r.output
+    assert r.stdout_bytes == expected_json(data)
+
+
+NOT_ALL_RELEASED_CASES: tuple[tuple[str, str, dict[str, Any]], ...] = (
+    (
+        "7",
+        "all",
+        {
+            "version": "7",
+            "level": "major",
+            "release_date": "2019-02-06",
+            "is_released": True,
+            "subversions": ["7.0", "7.1", "7.2", "7.3", "7.4"],
+            "cpython_series": ["2.7", "3.5", "3.6", "3.7", "3.8", "3.9"],
+        },
+    ),
+    (
+        "7",
+        "released",
+        {
+            "version": "7",
+            "level": "major",
+            "release_date": "2019-02-06",
+            "is_released": True,
+            "subversions": ["7.0", "7.1", "7.2", "7.3"],
+            "cpython_series": ["2.7", "3.5", "3.6", "3.7", "3.8"],
+        },
+    ),
+    (
+        "8.0",
+        "all",
+        {
+            "version": "8.0",
+            "level": "minor",
+            "release_date": None,
+            "is_released": False,
+            "subversions": ["8.0.0"],
+            "cpython_series": ["3.11"],
+        },
+    ),
+    (
+        "8.0",
+        "released",
+        {
+            "version": "8.0",
+            "level": "minor",
+            "release_date": None,
+            "is_released": False,
+            "subversions": [],
+            "cpython_series": [],
+        },
+    ),
+)
 
 
 @pytest.mark.parametrize(
-    "version,subversions,data,headers",
-    [
-        (
-            "7",
-            "all",
-            {
-                "version": "7",
-                "level": "major",
-                "release_date": "2019-02-06",
-                "is_released": True,
-                "subversions": ["7.0", "7.1", "7.2", "7.3", "7.4"],
-                "cpython_series": ["2.7", "3.5", "3.6", "3.7", "3.8", "3.9"],
-            },
-            (
-                "Version: 7\n"
-                "Level: major\n"
-                "Release-Date: 2019-02-06\n"
-                "Is-Released: yes\n"
-                "Subversions: 7.0, 7.1, 7.2, 7.3, 7.4\n"
-                "CPython-Series: 2.7, 3.5, 3.6, 3.7, 3.8, 3.9\n"
-            ),
-        ),
-        (
-            "7",
-            "released",
-            {
-                "version": "7",
-                "level": "major",
-                "release_date": "2019-02-06",
-                "is_released": True,
-                "subversions": ["7.0", "7.1", "7.2", "7.3"],
-                "cpython_series": ["2.7", "3.5", "3.6", "3.7", "3.8"],
-            },
-            (
-                "Version: 7\n"
-                "Level: major\n"
-                "Release-Date: 2019-02-06\n"
-                "Is-Released: yes\n"
-                "Subversions: 7.0, 7.1, 7.2, 7.3\n"
-                "CPython-Series: 2.7, 3.5, 3.6, 3.7, 3.8\n"
-            ),
-        ),
-        (
-            "8.0",
-            "all",
-            {
-                "version": "8.0",
-                "level": "minor",
-                "release_date": None,
-                "is_released": False,
-                "subversions": ["8.0.0"],
-                "cpython_series": ["3.11"],
-            },
-            (
-                "Version: 8.0\n"
-                "Level: minor\n"
-                "Release-Date: UNKNOWN\n"
-                "Is-Released: no\n"
-                "Subversions: 8.0.0\n"
-                "CPython-Series: 3.11\n"
-            ),
-        ),
-        (
-            "8.0",
-            "released",
-            {
-                "version": "8.0",
-                "level": "minor",
-                "release_date": None,
-                "is_released": False,
-                "subversions": [],
-                "cpython_series": [],
-            },
-            (
-                "Version: 8.0\n"
-                "Level: minor\n"
-                "Release-Date: UNKNOWN\n"
-                "Is-Released: no\n"
-                "Subversions: \n"
-                "CPython-Series: \n"
-            ),
-        ),
-    ],
+    "version,subversions,data",
+    NOT_ALL_RELEASED_CASES,
+    ids=[f"{v}-{s}" for v, s, _ in NOT_ALL_RELEASED_CASES],
 )
-def test_show_not_all_released(
-    version: str, subversions: str, data: dict, headers: str
-) -> None:
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--pypy", "--subversions", subversions, version]
+def test_show_not_all_released(version: str, subversions: str, data: dict) -> None:
+    headers = expected_headers(data)
+    r = run_cli(
+        "-d", DATA_FILE, "show", "--pypy", "--subversions", subversions, version
     )
-    assert r.exit_code == 0, show_result(r)
+    assert r.exit_code == 0, r.output
     assert r.output == headers
     if subversions == "released":
-        r = CliRunner().invoke(main, ["-d", DATA_FILE, "show", "--pypy", version])
-        assert r.exit_code == 0, show_result(r)
+        r = run_cli("-d", DATA_FILE, "show", "--pypy", version)
+        assert r.exit_code == 0, r.output
         assert r.output == headers
-    r = CliRunner().invoke(
-        main,
-        [
-            "-d",
-            DATA_FILE,
-            "show",
-            "--pypy",
-            "--json",
-            "--subversions",
-            subversions,
-            version,
-        ],
+    r = run_cli(
+        "-d",
+        DATA_FILE,
+        "show",
+        "--pypy",
+        "--json",
+        "--subversions",
+        subversions,
+        version,
     )
-    assert r.exit_code == 0, show_result(r)
-    assert json.loads(r.output) == data
+    assert r.exit_code == 0, r.output
+    assert r.stdout_bytes == expected_json(data)
 
 
 @pytest.mark.parametrize("v", ["7", "7.3"])
 def test_cmd_show_not_eol(v: str) -> None:
-    r = CliRunner().invoke(
-        main,
-        ["-d", DATA_FILE, "show", "--pypy", "--subversions", "not-eol", v],
-        standalone_mode=False,
-    )
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == "'not-eol' only applies to CPython versions"
+    with pytest.raises(click.UsageError) as excinfo:
+        main.main(
+            ["-d", DATA_FILE, "show", "--pypy", "--subversions", "not-eol", v],
+            prog_name="pyversion-info",
+            standalone_mode=False,
+        )
+    assert str(excinfo.value) == "'not-eol' only applies to CPython versions"
 
 
 @pytest.mark.parametrize("v", ["7", "7.3"])
 def test_cmd_show_supported(v: str) -> None:
-    r = CliRunner().invoke(
-        main,
-        ["-d", DATA_FILE, "show", "--pypy", "--subversions", "supported", v],
-        standalone_mode=False,
-    )
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == "'supported' only applies to CPython versions"
-
+    with pytest.raises(click.UsageError) as excinfo:
+        main.main(
+            ["-d", DATA_FILE, "show", "--pypy", "--subversions", "supported", v],
+            prog_name="pyversion-info",
+            standalone_mode=False,
+        )
+    assert str(excinfo.value) == "'supported' only applies to CPython versions"
 
-@pytest.mark.parametrize("v", ["", "1.2.3.4", "1.2.3rc1", "foobar", "a.b.c"])
-def test_show_invalid_version(v: str) -> None:
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--pypy", v], standalone_mode=False
-    )
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == f"Invalid version string: {v!r}"
 
-
-@pytest.mark.parametrize("v", ["0.8", "1.5", "3", "7.3.9", "9.0.0"])
-def test_show_unknown_version(v: str) -> None:
-    r = CliRunner().invoke(
-        main, ["-d", DATA_FILE, "show", "--pypy", v], standalone_mode=False
-    )
-    assert r.exit_code != 0
-    assert isinstance(r.exception, click.UsageError)
-    assert str(r.exception) == f"Unknown version: {v!r}"
+@pytest.mark.parametrize(
+    "v,expected",
+    [
+        ("", "Invalid version string: ''"),
+        ("1.2.3.4", "Invalid version string: '1.2.3.4'"),
+        ("1.2.3rc1", "Invalid version string: '1.2.3rc1'"),
+        ("foobar", "Invalid version string: 'foobar'"),
+        ("a.b.c", "Invalid version string: 'a.b.c'"),
+        ("0.8", "Unknown version: '0.8'"),
+        ("1.5", "Unknown version: '1.5'"),
+        ("3", "Unknown version: '3'"),
+        ("7.3.9", "Unknown version: '7.3.9'"),
+        ("9.0.0", "Unknown version: '9.0.0'"),
+    ],
+)
+def test_show_version_error(v: str, expected: str) -> None:
+    with pytest.raises(click.UsageError) as excinfo:
+        main.main(
+            ["-d", DATA_FILE, "show", "--pypy", v],
+            prog_name="pyversion-info",
+            standalone_mode=False,
+        )
+    assert str(excinfo.value) == expected
@@ -0,0 +1,114 @@
+from __future__ import annotations
+from collections.abc import Iterator
+import inspect
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, call
+from platformdirs import user_cache_dir
+import pytest
+import pyversion_info
+from pyversion_info import VersionDatabase
+
+DATA_FILE = Path(__file__).with_name("data") / "pyversion-info-data.json"
+
+
+def test_parse_file(version_database: VersionDatabase) -> None:
+    vdb = VersionDatabase.parse_file(DATA_FILE)
+    assert vdb is not version_database
+    assert vdb.last_modified == version_database.last_modified
+    assert vars(vdb.cpython) == vars(version_database.cpython)
+    assert vars(vdb.pypy) == vars(version_database.pypy)
+
+
+@pytest.fixture
+def mock_http(monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[Mock, Mock]]:
+    session = Mock()
+    session.get.return_value.content = DATA_FILE.read_bytes()
+    mock_session = Mock(return_value=session)
+    mock_cache_control = Mock(return_value=session)
+    monkeypatch.setattr("requests.Session", mock_session)
+    monkeypatch.setattr("cachecontrol.CacheControl", mock_cache_control)
+    VersionDatabase.clear_session_cache()
+    yield (mock_session, mock_cache_control)
+    VersionDatabase.clear_session_cache()
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_fetch_reuses_session(
+    mock_http: tuple[Mock, Mock], tmp_path: Path, cached: bool
+) -> None:
+    mock_session, mock_cache_control = mock_http
+    cache_dir = tmp_path if cached else None
+    vdb1 = VersionDatabase.fetch("https://example.com/db.json", cache_dir=cache_dir)
+    vdb2 = VersionDatabase.fetch("https://example.com/db.json", cache_dir=cache_dir)
+    assert vdb1.last_modified == vdb2.last_modified
+    mock_session.assert_called_once_with()
+    assert mock_cache_control.call_count == int(cached)
+    session = mock_session.return_value
+    assert session.get.call_args_list == [call("https://example.com/db.json")] * 2
+    session.close.assert_not_called()
+
+
+def test_fetch_does_not_hold_lock(mock_http: tuple[Mock, Mock]) -> None:
+    mock_session, _ = mock_http
+    session = mock_session.return_value
+    response = session.get.return_value
+
+    def get(_url: str) -> Any:
+        # Other threads' fetches & `clear_session_cache()` must not have to
+        # wait for this request to finish
+        assert not pyversion_info._SESSION_LOCK.locked()
+        return response
+
+    session.get.side_effect = get
+    VersionDatabase.fetch("https://example.com/db.json", cache_dir=None)
+    session.get.assert_called_once_with("https://example.com/db.json")
+
+
+def test_clear_session_cache(mock_http: tuple[Mock, Mock], tmp_path: Path) -> None:
+    mock_session, _ = mock_http
+    session = mock_session.return_value
+    VersionDatabase.fetch("https://example.com/db.json", cache_dir=tmp_path)
+    VersionDatabase.clear_session_cache()
+    session.close.assert_called_once_with()
+    VersionDatabase.fetch("https://example.com/db.json", cache_dir=tmp_path)
+    assert mock_session.call_count == 2
+
+
+def test_fetch_default_cache_dir(
+    mock_http: tuple[Mock, Mock], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    mock_session, mock_cache_control = mock_http
+    monkeypatch.setattr(pyversion_info, "_get_cache_dir", lambda: str(tmp_path))
+    VersionDatabase.fetch("https://example.com/db.json")
+    VersionDatabase.fetch("https://example.com/db.json", cache_dir=tmp_path)
+    # Both calls resolve to the same cache directory and thus the same session
+    mock_session.assert_called_once_with()
+    mock_cache_control.assert_called_once()
+    assert mock_cache_control.call_args.kwargs["cache"].directory == str(tmp_path)
+
+
+def test_cache_dir() -> None:
+    assert pyversion_info.CACHE_DIR == user_cache_dir("pyversion-info", "jwodder")
+
+
+def test_fetch_platform_cache_dir(mock_http: tuple[Mock, Mock]) -> None:
+    _, mock_cache_control = mock_http
+    VersionDatabase.fetch("https://example.com/db.json")
+    mock_cache_control.assert_called_once()
+    cache = mock_cache_control.call_args.kwargs["cache"]
+    assert cache.directory == user_cache_dir("pyversion-info", "jwodder")
+
+
+def test_fetch_default_repr() -> None:
+    param = inspect.signature(VersionDatabase.fetch).parameters["cache_dir"]
+    assert param.annotation == "str | Path | None"
+    assert repr(param.default) == "CACHE_DIR"
+
+
+def test_no_such_attribute() -> None:
+    with pytest.raises(AttributeError) as excinfo:
+        pyversion_info.totally_bogus_name  # type: ignore[attr-defined]  # noqa: B018
+    assert str(excinfo.value) == (
+        "module 'pyversion_info' has no attribute 'totally_bogus_name'"
+    )
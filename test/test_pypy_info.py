@@ -1,74 +1,69 @@
 from __future__ import annotations
+from datetime import date
+from helpers import fixed_date
 import pytest
-from pytest_mock import MockerFixture
-from pyversion_info import PyPyVersionInfo, UnknownVersionError, VersionDatabase
-
-INVALID_VERSIONS = ["", "1.2.3.4", "1.2.3rc1", "foobar", "a.b.c"]
-
-
-@pytest.fixture(autouse=True)
-def use_fixed_date(mocker: MockerFixture) -> None:
-    mocker.patch("time.time", return_value=1635992101)
-    # Time is now 2021-11-04T02:15:01+00:00.
-
-
-@pytest.fixture(scope="module")
-def pypyinfo(version_database: VersionDatabase) -> PyPyVersionInfo:
-    return version_database.pypy
+from pyversion_info import PyPyVersionInfo, UnknownVersionError
+
+INVALID_VERSIONS = ("", "1.2.3.4", "1.2.3rc1", "foobar", "a.b.c")
+
+
+use_fixed_date = fixed_date(date(2021, 11, 3))
+
+
+SUPPORTED_CPYTHON = (
+    ("1.6.0", ["2.7.1"]),
+    ("1.7.0", ["2.7.1"]),
+    ("1.8.0", ["2.7.2"]),
+    ("1.9.0", ["2.7.2"]),
+    ("2.0.0", ["2.7.3"]),
+    ("2.0.1", ["2.7.3"]),
+    ("2.0.2", ["2.7.3"]),
+    ("2.1.0", ["2.7.3"]),
+    ("2.2.0", ["2.7.3"]),
+    ("2.2.1", ["2.7.3"]),
+    ("2.3.0", ["2.7.6"]),
+    ("2.3.1", ["2.7.6", "3.2.5"]),
+    ("2.4.0", ["2.7.8", "3.2.5"]),
+    ("2.5.0", ["2.7.8"]),
+    ("2.5.1", ["2.7.9"]),
+    ("2.6.0", ["2.7.9"]),
+    ("2.6.1", ["2.7.10"]),
+    ("4.0.0", ["2.7.10"]),
+    ("4.0.1", ["2.7.10"]),
+    ("5.0.0", ["2.7.10"]),
+    ("5.0.1", ["2.7.10"]),
+    ("5.1.0", ["2.7.10"]),
+    ("5.1.1", ["2.7.10"]),
+    ("5.1.2", ["2.7.10"]),
+    ("5.3.0", ["2.7.10"]),
+    ("5.3.1", ["2.7.10"]),
+    ("5.4.0", ["2.7.10"]),
+    ("5.4.1", ["2.7.10"]),
+    ("5.6.0", ["2.7.12"]),
+    ("5.7.0", ["2.7.13", "3.5.2"]),
+    ("5.7.1", ["2.7.13", "3.5.2"]),
+    ("5.8.0", ["2.7.13", "3.5.3"]),
+    ("5.9.0", ["2.7.13", "3.5.3"]),
+    ("5.10.0", ["2.7.13", "3.5.3"]),
+    ("5.10.1", ["3.5.3"]),
+    ("6.0.0", ["2.7.13", "3.5.3"]),
+    ("7.0.0", ["2.7.13", "3.6.1"]),
+    ("7.1.0", ["2.7.13", "3.5.3", "3.6.1"]),
+    ("7.1.1", ["2.7.13", "3.6.1"]),
+    ("7.2.0", ["2.7.13", "3.6.9"]),
+    ("7.3.0", ["2.7.13", "3.6.9"]),
+    ("7.3.1", ["2.7.13", "3.6.9"]),
+    ("7.3.2", ["2.7.13", "3.6.9", "3.7.4"]),
+    ("7.3.3", ["2.7.18", "3.6.12", "3.7.9"]),
+    ("7.3.4", ["2.7.18", "3.7.10"]),
+    ("7.3.5", ["2.7.18", "3.7.10"]),
+    ("7.3.6", ["2.7.18", "3.7.12", "3.8.12"]),
+    ("7.3.7", ["3.7.12", "3.8.12"]),
+)
 
 
 @pytest.mark.parametrize(
-    "version,cpythons",
-    [
-        ("1.6.0", ["2.7.1"]),
-        ("1.7.0", ["2.7.1"]),
-        ("1.8.0", ["2.7.2"]),
-        ("1.9.0", ["2.7.2"]),
-        ("2.0.0", ["2.7.3"]),
-        ("2.0.1", ["2.7.3"]),
-        ("2.0.2", ["2.7.3"]),
-        ("2.1.0", ["2.7.3"]),
-        ("2.2.0", ["2.7.3"]),
-        ("2.2.1", ["2.7.3"]),
-        ("2.3.0", ["2.7.6"]),
-        ("2.3.1", ["2.7.6", "3.2.5"]),
-        ("2.4.0", ["2.7.8", "3.2.5"]),
-        ("2.5.0", ["2.7.8"]),
-        ("2.5.1", ["2.7.9"]),
-        ("2.6.0", ["2.7.9"]),
-        ("2.6.1", ["2.7.10"]),
-        ("4.0.0", ["2.7.10"]),
-        ("4.0.1", ["2.7.10"]),
-        ("5.0.0", ["2.7.10"]),
-        ("5.0.1", ["2.7.10"]),
-        ("5.1.0", ["2.7.10"]),
-        ("5.1.1", ["2.7.10"]),
-        ("5.1.2", ["2.7.10"]),
-        ("5.3.0", ["2.7.10"]),
-        ("5.3.1", ["2.7.10"]),
-        ("5.4.0", ["2.7.10"]),
-        ("5.4.1", ["2.7.10"]),
-        ("5.6.0", ["2.7.12"]),
-        ("5.7.0", ["2.7.13", "3.5.2"]),
-        ("5.7.1", ["2.7.13", "3.5.2"]),
-        ("5.8.0", ["2.7.13", "3.5.3"]),
-        ("5.9.0", ["2.7.13", "3.5.3"]),
-        ("5.10.0", ["2.7.13", "3.5.3"]),
-        ("5.10.1", ["3.5.3"]),
-        ("6.0.0", ["2.7.13", "3.5.3"]),
-        ("7.0.0", ["2.7.13", "3.6.1"]),
-        ("7.1.0", ["2.7.13", "3.5.3", "3.6.1"]),
-        ("7.1.1", ["2.7.13", "3.6.1"]),
-        ("7.2.0", ["2.7.13", "3.6.9"]),
-        ("7.3.0", ["2.7.13", "3.6.9"]),
-        ("7.3.1", ["2.7.13", "3.6.9"]),
-        ("7.3.2", ["2.7.13", "3.6.9", "3.7.4"]),
-        ("7.3.3", ["2.7.18", "3.6.12", "3.7.9"]),
-        ("7.3.4", ["2.7.18", "3.7.10"]),
-        ("7.3.5", ["2.7.18", "3.7.10"]),
-        ("7.3.6", ["2.7.18", "3.7.12", "3.8.12"]),
-        ("7.3.7", ["3.7.12", "3.8.12"]),
-    ],
+    "version,cpythons", SUPPORTED_CPYTHON, ids=[v for v, _ in SUPPORTED_CPYTHON]
 )
 def test_supported_cpython(
     pypyinfo: PyPyVersionInfo, version: str, cpythons: list[str]
@@ -76,7 +71,7 @@ def test_supported_cpython(
     assert pypyinfo.supported_cpython(version) == cpythons
 
 
-@pytest.mark.parametrize("v", INVALID_VERSIONS + ["7.3", "7"])
+@pytest.mark.parametrize("v", (*INVALID_VERSIONS, "7.3", "7"))
 def test_supported_cpython_invalid(pypyinfo: PyPyVersionInfo, v: str) -> None:
     with pytest.raises(ValueError) as excinfo:
         pypyinfo.supported_cpython(v)
@@ -1,5 +1,23 @@
+from __future__ import annotations
+from collections.abc import Sequence
 import pytest
-from pyversion_info.util import MajorVersion, MicroVersion, MinorVersion
+from pyversion_info.util import MajorVersion, MicroVersion, MinorVersion, Version
+
+
+def assert_ascending(versions: Sequence[Version]) -> None:
+    # `versions` must be given in strictly increasing order.  Sorting the
+    # reversed list checks that `__lt__` uses version rather than string order.
+    assert sorted(versions[::-1]) == list(versions)
+    for v in versions:
+        assert v == v, v
+        assert v <= v, v
+        assert v >= v, v
+    for a, b in zip(versions, versions[1:]):
+        assert a != b, (a, b)
+        assert a < b, (a, b)
+        assert a <= b, (a, b)
+        assert b > a, (a, b)
+        assert b >= a, (a, b)
 
 
 @pytest.mark.parametrize(
@@ -15,22 +33,26 @@ def test_major_version(vstr: str, x: int) -> None:
     assert v == vstr
     assert str(v) == vstr
     assert repr(v) == f"MajorVersion({vstr!r})"
+    assert not hasattr(v, "__dict__")
     assert v.x == x
     assert v.parts == (x,)
+    assert v.parts is v.parts
     assert MajorVersion.construct(x) == v
+    assert MajorVersion.construct(x) is MajorVersion.construct(x)
+
+
+@pytest.mark.parametrize("vstr", ["", "3.6", "-3", "3a", " 3", "\u00b2"])
+def test_major_version_invalid(vstr: str) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        MajorVersion(vstr)
+    assert str(excinfo.value) == f"Invalid major version: {vstr!r}"
+
+
+MAJOR_VERSIONS = tuple(map(MajorVersion, ["2", "3", "10"]))
 
 
 def test_major_version_cmp() -> None:
-    VERSIONS = list(map(MajorVersion, ["2", "3", "10"]))
-    for i in range(len(VERSIONS) - 1):
-        assert VERSIONS[i] == VERSIONS[i]
-        assert VERSIONS[i] >= VERSIONS[i]
-        assert VERSIONS[i] <= VERSIONS[i]
-        assert VERSIONS[i] != VERSIONS[i + 1]
-        assert VERSIONS[i] < VERSIONS[i + 1]
-        assert VERSIONS[i + 1] > VERSIONS[i]
-        assert VERSIONS[i] <= VERSIONS[i + 1]
-        assert VERSIONS[i + 1] >= VERSIONS[i]
+    assert_ascending(MAJOR_VERSIONS)
 
 
 @pytest.mark.parametrize(
@@ -46,23 +68,27 @@ def test_minor_version(vstr: str, x: int, y: int) -> None:
     assert v == vstr
     assert str(v) == vstr
     assert repr(v) == f"MinorVersion({vstr!r})"
+    assert not hasattr(v, "__dict__")
     assert v.x == x
     assert v.y == y
     assert v.parts == (x, y)
+    assert v.parts is v.parts
     assert MinorVersion.construct(x, y) == v
+    assert MinorVersion.construct(x, y) is MinorVersion.construct(x, y)
+
+
+@pytest.mark.parametrize("vstr", ["", "3", "3.", ".6", "3.6.1", "3.6rc1", "3..6"])
+def test_minor_version_invalid(vstr: str) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        MinorVersion(vstr)
+    assert str(excinfo.value) == f"Invalid minor version: {vstr!r}"
+
+
+MINOR_VERSIONS = tuple(map(MinorVersion, ["2.0", "2.7", "3.0", "3.6", "3.10"]))
 
 
 def test_minor_version_cmp() -> None:
-    VERSIONS = list(map(MinorVersion, ["2.0", "2.7", "3.0", "3.6", "3.10"]))
-    for i in range(len(VERSIONS) - 1):
-        assert VERSIONS[i] == VERSIONS[i]
-        assert VERSIONS[i] >= VERSIONS[i]
-        assert VERSIONS[i] <= VERSIONS[i]
-        assert VERSIONS[i] != VERSIONS[i + 1]
-        assert VERSIONS[i] < VERSIONS[i + 1]
-        assert VERSIONS[i + 1] > VERSIONS[i]
-        assert VERSIONS[i] <= VERSIONS[i + 1]
-        assert VERSIONS[i + 1] >= VERSIONS[i]
+    assert_ascending(MINOR_VERSIONS)
 
 
 @pytest.mark.parametrize(
@@ -78,27 +104,34 @@ def test_micro_version(vstr: str, x: int, y: int, z: int, minor: str) -> None:
     assert v == vstr
     assert str(v) == vstr
     assert repr(v) == f"MicroVersion({vstr!r})"
+    assert not hasattr(v, "__dict__")
     assert v.x == x
     assert v.y == y
     assert v.z == z
     assert v.parts == (x, y, z)
+    assert v.parts is v.parts
     assert MicroVersion.construct(x, y, z) == v
+    assert MicroVersion.construct(x, y, z) is MicroVersion.construct(x, y, z)
     assert v.minor == MinorVersion(minor)
+    assert v.minor is MinorVersion.construct(x, y)
 
 
-def test_micro_version_cmp() -> None:
-    VERSIONS = list(
-        map(
-            MicroVersion,
-            ["2.0.1", "2.1.0", "2.7.5", "3.1.3", "3.6.0", "3.6.2", "3.6.10", "3.10.0"],
-        )
+@pytest.mark.parametrize(
+    "vstr", ["", "3.6", "3.6.", "3.6.1.2", "3.6.1rc1", "a.b.c", "3.6.\u00b2"]
+)
+def test_micro_version_invalid(vstr: str) -> None:
+    with pytest.raises(ValueError) as excinfo:
+        MicroVersion(vstr)
+    assert str(excinfo.value) == f"Invalid micro version: {vstr!r}"
+
+
+MICRO_VERSIONS = tuple(
+    map(
+        MicroVersion,
+        ["2.0.1", "2.1.0", "2.7.5", "3.1.3", "3.6.0", "3.6.2", "3.6.10", "3.10.0"],
     )
-    for i in range(len(VERSIONS) - 1):
-        assert VERSIONS[i] == VERSIONS[i]
-        assert VERSIONS[i] >= VERSIONS[i]
-        assert VERSIONS[i] <= VERSIONS[i]
-        assert VERSIONS[i] != VERSIONS[i + 1]
-        assert VERSIONS[i] < VERSIONS[i + 1]
-        assert VERSIONS[i + 1] > VERSIONS[i]
-        assert VERSIONS[i] <= VERSIONS[i + 1]
-        assert VERSIONS[i + 1] >= VERSIONS[i]
+)
+
+
+def test_micro_version_cmp() -> None:
+    assert_ascending(MICRO_VERSIONS)